@@ -218,7 +218,11 @@ class System(component.Component):
 
     @timer
     def _construct_components(self):
-        components_to_load = pd.read_csv(self.dir_str.data_interim_dir / "systems" / self.name / "components.csv")
+        # Read component names as strings (like the linkage CSVs), so numeric-looking names still match each other
+        components_to_load = pd.read_csv(
+            self.dir_str.data_interim_dir / "systems" / self.name / "components.csv",
+            dtype={"component": str, "instance": str},
+        )
 
         components_to_load = components_to_load.sort_values(["component", "instance"]).groupby("component")
 
@@ -259,8 +263,11 @@ class System(component.Component):
     def _construct_linkages(self, *, linkage_subclasses_to_load: list, linkage_type: str, linkage_cls):
         """This function now can be used to initialize both two- and three-way linkages."""
         if (self.dir_str.data_interim_dir / "systems" / self.name / f"{linkage_type}.csv").exists():
+            # Component names are joined against `self.components` & the linkage attribute CSVs, so read them with
+            # the same string dtype everywhere
             linkages_to_load = pd.read_csv(
-                self.dir_str.data_interim_dir / "systems" / self.name / f"{linkage_type}.csv"
+                self.dir_str.data_interim_dir / "systems" / self.name / f"{linkage_type}.csv",
+                dtype={"linkage": str, "component_from": str, "component_to": str},
             )
             linkages_to_load = self._get_scenario_linkages(linkages=linkages_to_load, scenarios=self.scenarios)
             linkages_to_load = linkages_to_load.groupby("linkage")
@@ -2,6 +2,7 @@ import json
 import os
 import pathlib
 import re
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -33,6 +34,9 @@ class Component(custom_model.CustomModel):
     )
     """Based class to implement a standard `from_csv` class method to read from `interim` data folder."""
 
+    # Timeseries attribute names by (class, include_aliases), filled lazily by `get_timeseries_attribute_names`
+    _timeseries_attribute_names_cache: ClassVar[dict[tuple[type, bool], tuple[str, ...]]] = {}
+
     def __repr__(self):
         """WORKAROUND because default pydantic model __repr__ causing trouble with error handling."""
 
@@ -40,20 +44,24 @@ class Component(custom_model.CustomModel):
 
     @classmethod
     def get_timeseries_attribute_names(cls, include_aliases: bool = False):
-        attribute_names = [
-            attr
-            for attr, field_settings in cls.__fields__.items()
-            if field_settings.type_ in ts.Timeseries.__subclasses__()
-        ]
-
-        if include_aliases:
-            attribute_names += [
-                field_settings.alias
-                for attr, field_settings in cls.__fields__.items()
-                if field_settings.type_ in ts.Timeseries.__subclasses__() and field_settings.alias is not None
+        # Field definitions are fixed once a class is created, so only walk `__fields__` once per (class, aliases) pair
+        cache_key = (cls, include_aliases)
+        if cache_key not in Component._timeseries_attribute_names_cache:
+            timeseries_types = frozenset(ts.Timeseries.__subclasses__())
+            attribute_names = [
+                attr for attr, field_settings in cls.__fields__.items() if field_settings.type_ in timeseries_types
             ]
 
-        return attribute_names
+            if include_aliases:
+                attribute_names += [
+                    field_settings.alias
+                    for attr, field_settings in cls.__fields__.items()
+                    if field_settings.type_ in timeseries_types and field_settings.alias is not None
+                ]
+            Component._timeseries_attribute_names_cache[cache_key] = tuple(attribute_names)
+
+        # Return a new list so callers can't modify the cached names
+        return list(Component._timeseries_attribute_names_cache[cache_key])
 
     @classmethod
     def get_timeseries_default_freqs(cls):
@@ -99,11 +107,7 @@ class Component(custom_model.CustomModel):
     @property
     def timeseries_attrs(self):
         # find all timeseries attributes in instance
-        return [
-            attr
-            for attr, field_settings in self.__fields__.items()
-            if field_settings.type_ in ts.Timeseries.__subclasses__()
-        ]
+        return self.get_timeseries_attribute_names()
 
     @classmethod
     def _parse_units(cls):
@@ -157,8 +161,14 @@ class Component(custom_model.CustomModel):
                     logger.debug(f"{msg}, CSV file reference ignored because it is **not** highest scenario priority.")
                     input_df = input_df.loc[input_df.index != "None"]
 
-        # Keep only highest priority scenario data
-        input_df = input_df.groupby(input_df.index.names).last()
+        # Keep only highest priority scenario data (`input_df` is sorted from lowest to highest priority).
+        # `groupby().last()` takes the last non-null value of each column (and drops null index keys), so only use the
+        # cheaper "keep last row" when there are no nulls for it to skip
+        has_nulls = input_df.isna().to_numpy().any() or input_df.index.to_frame(index=False).isna().to_numpy().any()
+        if has_nulls:
+            input_df = input_df.groupby(input_df.index.names).last()
+        else:
+            input_df = input_df.loc[~input_df.index.duplicated(keep="last")].sort_index()
 
         # TODO FINISH THIS
         scenarios_used = set(input_df["scenario"].unique())
@@ -190,18 +200,16 @@ class Component(custom_model.CustomModel):
         ]
 
         # TODO: Need to figure out a way to initialize the `timezone` and `DST` attribute
-        # Deep copy used to avoid pandas "SettingWithCopyWarning"
-        ts_df = input_df.loc[input_df["attribute"].isin(attribute_names), :]
-
-        nodate_ts_df = input_df.loc[input_df["attribute"].isin(attribute_names), :].copy(deep=True)
+        # No copy needed: the slice is only read, and `set_index` below returns new frames
+        nodate_ts_df = input_df.loc[input_df["attribute"].isin(attribute_names), :]
         nodate_ts_attrs = {}
-        for attr in nodate_ts_df["attribute"].unique():
-            ts_slice = nodate_ts_df.loc[nodate_ts_df["attribute"] == attr, ["timestamp", "value"]].set_index(
-                ["timestamp"]
-            )
+        # Split by attribute in one groupby pass (rather than one equality scan per attribute)
+        for attr, attr_df in nodate_ts_df.groupby("attribute", sort=False):
+            ts_slice = attr_df.loc[:, ["timestamp", "value"]].set_index(["timestamp"])
 
-            # Get last instance of any duplicate values (for scenario tagging)
-            ts_slice = ts_slice.groupby(ts_slice.index).last()
+            # Get last instance of any duplicate values (for scenario tagging). `groupby().last()` takes the last
+            # non-null value & drops null timestamps, unlike keeping the last duplicate row
+            ts_slice = ts_slice.groupby(level=0).last()
 
             if len(ts_slice) == 1:
                 ts_data = ts_slice.to_dict()["value"]
@@ -230,19 +238,19 @@ class Component(custom_model.CustomModel):
 
         # Need to loop through each timeseries attribute separately and fill dict of ts.Timeseries instances
         ts_attrs = {}
-        for attr in ts_df["attribute"].unique():
-            ts_slice = ts_df.loc[ts_df["attribute"] == attr, :].set_index(["timestamp"])
+        # Split by attribute in one groupby pass (rather than one equality scan per attribute)
+        for attr, attr_df in ts_df.groupby("attribute", sort=False):
+            ts_slice = attr_df.set_index(["timestamp"])
 
             ts_slice = cls._filter_highest_scenario(filename=filename, input_df=ts_slice, scenarios=scenarios)
 
-            # Try to parse index as datetime (if index is not "None")
-            if "None" not in ts_slice.index:
-                ts_slice.index = pd.to_datetime(ts_slice.index, infer_datetime_format=True)
-
             # If timeseries is a filepath reference, ts_data should be a string to be parsed by `Timeseries.validate_or_convert_to_series`
-            if ts_slice.index.values.tolist() == ["None"]:
+            # (`_filter_highest_scenario` already dropped either the "None" row or all timestamped rows)
+            if "None" in ts_slice.index:
                 ts_data = ts_slice.loc["None", "value"]
+            # Otherwise, parse index as datetime
             else:
+                ts_slice.index = pd.to_datetime(ts_slice.index, infer_datetime_format=True)
                 ts_data = ts_slice.squeeze(axis=1)
 
             # Construct Timeseries object for attribute (otherwise silently default to None/empty attribute)
@@ -373,7 +381,7 @@ class Component(custom_model.CustomModel):
         #. The ``scenario`` column is converted to a `pd.Categorical`_, which is an ordered list.
         #. The ``scenario`` columns is sorted based on the Categorical ordering,
            where values with no scenario tag (``None``/``NaN``) are lowest-priority.
-        #. The method ``df.groupby.last()`` is used to take the last (highest-priority) value
+        #. Only the last (highest-priority) row for each attribute/timestamp is kept via ``df.index.duplicated()``
            (since the dataframe should be sorted from lowest to highest priority scenario tag).
         #. Scenario tags that are not listed in scenarios.csv will be ignored completely (dropped from the dataframe).
 
@@ -657,11 +665,7 @@ class Component(custom_model.CustomModel):
         weather_year_start, weather_year_end = weather_years
 
         # find all timeseries attributes in instance
-        timeseries_attrs = [
-            attr
-            for attr, field_settings in self.__fields__.items()
-            if field_settings.type_ in ts.Timeseries.__subclasses__()
-        ]
+        timeseries_attrs = self.get_timeseries_attribute_names()
 
         extrapolated = set()
         for attr in timeseries_attrs:
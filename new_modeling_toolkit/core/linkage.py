@@ -1,6 +1,7 @@
 import enum
 import os
 import pathlib
+import sys
 import typing
 from typing import List
 from typing import Optional
@@ -44,7 +45,9 @@ class Linkage(component.Component):
 
     _RELATIONSHIP_TYPE: LinkageRelationshipType
 
-    _instances: typing.ClassVar = {}
+    # Single registry shared by all subclasses (keyed by class name). References are deliberately strong: until
+    # `announce_linkage_to_instances` runs, this registry is the only owner of newly-constructed linkages.
+    _instances: typing.ClassVar[dict[str, list["Linkage"]]] = {}
     _component_type_from: typing.ClassVar = None
     _component_type_to: typing.ClassVar = None
     _class_descriptor: typing.ClassVar = ""  # This is the name for printing the info message
@@ -55,12 +58,23 @@ class Linkage(component.Component):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._register_instance()
 
+    def _register_instance(self):
         # Append new instance to the `_instances` class attribute
-        if self.__class__.__name__ not in Linkage._instances.keys():
-            Linkage._instances.update({self.__class__.__name__: [self]})
-        else:
-            Linkage._instances[self.__class__.__name__].append(self)
+        Linkage._instances.setdefault(self.__class__.__name__, []).append(self)
+
+    @classmethod
+    def _construct_without_validation(cls, **kwargs):
+        """Create (and register) a linkage instance using `construct()`, which skips pydantic validation.
+
+        Only safe for trusted data, i.e. linkage classes without an `_attribute_file`, which have no instance fields
+        beyond the linkage name and the linked component instances.
+        """
+        linkage_instance = cls.construct(**kwargs)
+        linkage_instance._register_instance()
+
+        return linkage_instance
 
     def dict(self, **kwargs):
         """Need to exclude `_instance_from`, `_instance_to` attributes to avoid recursion error when saving to JSON."""
@@ -125,19 +139,38 @@ class Linkage(component.Component):
         filtered_linkages_df = cls._filter_scenarios(
             linkages_df=linkages_df, scenarios=scenarios, filepath=linkages_csv_path
         )
-        linkage_pairs = list(
-            filtered_linkages_df.loc[:, ["component_from", "component_to"]].itertuples(index=False, name=None)
-        )
+        # Component names repeat across many linkages, so intern them to share one string object per name
+        linkage_pairs = [
+            (_intern_name(name_from), _intern_name(name_to))
+            for name_from, name_to in filtered_linkages_df.loc[:, ["component_from", "component_to"]].itertuples(
+                index=False, name=None
+            )
+        ]
 
         # TODO (5/13): from_csv shares similarities with Component.from_csv...maybe want to generalize both later
         # Read in _attribute_file data as needed
         linkage_attributes = None
         if cls._attribute_file is not None:  # Read in CSV attributes file if it exists
-            input_df = pd.read_csv(pathlib.Path(dir_path) / cls._attribute_file)
+            # Name & attribute columns are always strings, so skip dtype inference on them (this also keeps
+            # numeric-looking component names as strings that match `components_dict` keys). `usecols` isn't set,
+            # since the optional columns (e.g., `timestamp`, `scenario`) vary by file
+            input_df = pd.read_csv(
+                pathlib.Path(dir_path) / cls._attribute_file,
+                dtype={"component_from": str, "component_to": str, "attribute": str},
+            )
             linkage_attributes = cls._filter_scenarios(
                 linkages_df=input_df, scenarios=scenarios, filepath=pathlib.Path(dir_path) / cls._attribute_file
             )
-            linkage_attributes = linkage_attributes.groupby(["component_from", "component_to"])
+            # Split attributes by linkage pair in one groupby pass (instead of a `get_group()` lookup per linkage pair)
+            linkage_attributes = {
+                linkage_pair: pair_attributes.drop(columns=["component_from", "component_to"])
+                for linkage_pair, pair_attributes in linkage_attributes.groupby(["component_from", "component_to"])
+            }
+
+        # For `AllToPolicy` class the component_type from is an input, for all the other classes it is a class level
+        # static attr. Check the class by identity once, rather than re-comparing class names for every linkage.
+        is_all_to_policy = cls is AllToPolicy
+        component_type_to = cls._component_type_to
 
         # Construct linkage instances
         unmatched_linkages = []
@@ -146,13 +179,10 @@ class Linkage(component.Component):
             desc=f"Loading {cls.__name__}".rjust(32),
             bar_format="{l_bar}{bar:30}{r_bar}{bar:-10b}",
         ):
-            # For `AllToPolicy` class the component_type from is an input, for all the other classes it is a class
-            # level static attrs
-            if cls == AllToPolicy:
+            if is_all_to_policy:
                 component_type_from = find_component_type(components_dict, name_from)
             else:
                 component_type_from = cls._component_type_from
-            component_type_to = cls._component_type_to
 
             # obtain the linked inst from and to from the components dictionary
             instance_from = (
@@ -163,27 +193,29 @@ class Linkage(component.Component):
             if instance_from is None or instance_to is None:
                 unmatched_linkages += [f"{cls.__name__}({name_from}, {name_to})"]
             else:
-                if linkage_attributes is None or (name_from, name_to) not in linkage_attributes.groups:
-                    linkage_instance = cls(
-                        name=(name_from, name_to), _instance_from=instance_from, _instance_to=instance_to
-                    )
+                # Pass linked instances & component type in as construction data (instead of setting them afterwards).
+                # This ensures _component_type_from is correct. New instances register themselves in `_instances`.
+                linkage_data = {
+                    "_instance_from": instance_from,
+                    "_instance_to": instance_to,
+                    "_component_type_from": (
+                        "assets_" if is_all_to_policy and component_type_from == "assets" else component_type_from
+                    ),
+                }
+                if linkage_attributes is None:
+                    # No attributes file means no instance fields to validate, so skip pydantic validation
+                    cls._construct_without_validation(name=(name_from, name_to), **linkage_data)
+                elif (name_from, name_to) not in linkage_attributes:
+                    cls(name=(name_from, name_to), **linkage_data)
                 else:
-                    _, linkage_instance = cls._parse_vintages(
+                    cls._parse_vintages(
                         filename=pathlib.Path(dir_path) / cls._attribute_file,
-                        input_df=linkage_attributes.get_group((name_from, name_to)).drop(
-                            columns=["component_from", "component_to"]
-                        ),
+                        input_df=linkage_attributes[(name_from, name_to)],
                         separate_vintages=False,
                         scenarios=scenarios,
-                        data={"_instance_from": instance_from, "_instance_to": instance_to},
+                        data=linkage_data,
                         name=(name_from, name_to),
-                    ).popitem()
-
-                # This ensures _component_type_from is correct.
-                if cls.__name__ == "AllToPolicy" and component_type_from == "assets":
-                    linkage_instance._component_type_from = "assets_"
-                else:
-                    linkage_instance._component_type_from = component_type_from
+                    )
 
         if len(unmatched_linkages) > 0:
             logger.warning(
@@ -212,8 +244,11 @@ class Linkage(component.Component):
                 desc=f"Loading {cls.__name__}".rjust(32),
                 bar_format="{l_bar}{bar:30}{r_bar}{bar:-10b}",
             ):
-                logger.debug(
-                    f"Announcing linkage between '{linkage._instance_from.name}', '{linkage._instance_to.name}'"
+                # Lazy formatting, so the message isn't built unless debug logging is enabled
+                logger.opt(lazy=True).debug(
+                    "Announcing linkage between '{}', '{}'",
+                    lambda: linkage._instance_from.name,
+                    lambda: linkage._instance_to.name,
                 )
                 # Unpack the tuple
                 name_from, name_to = linkage.name
@@ -225,12 +260,12 @@ class Linkage(component.Component):
                 # TODO (2021-11-16): Related to #380, can simplify this (if default linkage attribute is {} instead of None)
                 for instance, attr, name in linkage_tuple:
                     if attr is not None:
-                        if getattr(instance, attr) is None:
+                        linked = instance.__dict__.get(attr)
+                        if linked is None:
                             # Create a new dict
-                            instance.__dict__[attr] = {name: linkage}
-                        else:
-                            # Update the dict with additional values
-                            instance.__dict__[attr].update({name: linkage})
+                            linked = instance.__dict__[attr] = {}
+                        # Insert directly (rather than building a throwaway dict for `.update()`)
+                        linked[name] = linkage
 
     @classmethod
     def save_instance_attributes_csvs(cls, wb, data: pd.DataFrame, save_path: pathlib.Path, overwrite: bool = True):
@@ -762,6 +797,23 @@ class FinalFuelToFuelZone(Linkage):
     # None
 
 
+def _validate_from_zone_xor_to_zone(cls, values):
+    """Validate that exactly one of `from_zone` and `to_zone` is set to True.
+
+    Shared by the linkages that tie a path (transmission or fuel transportation) to its two endpoint zones.
+    """
+    if not values["from_zone"] and not values["to_zone"]:
+        raise ValueError(
+            f"{cls.__name__} linkage for {values['name']} must have either 'from_zone' or 'to_zone' set to True."
+        )
+    elif values["from_zone"] and values["to_zone"]:
+        raise ValueError(
+            f"{cls.__name__} linkage for {values['name']} must have either 'from_zone' or 'to_zone' set to True, but not both."
+        )
+    else:
+        return values
+
+
 class ZoneToTransmissionPath(Linkage):
     ####################
     # CLASS ATTRIBUTES #
@@ -781,19 +833,7 @@ class ZoneToTransmissionPath(Linkage):
     from_zone: bool = False
     to_zone: bool = False
 
-    @pydantic.root_validator
-    def linkage_is_from_zone_xor_to_zone(cls, values):
-        """Validate that exactly one of `from_zone` and `to_zone` is set to True."""
-        if not values["from_zone"] and not values["to_zone"]:
-            raise ValueError(
-                f"{cls.__name__} linkage for {values['name']} must have either 'from_zone' or 'to_zone' set to True."
-            )
-        elif values["from_zone"] and values["to_zone"]:
-            raise ValueError(
-                f"{cls.__name__} linkage for {values['name']} must have either 'from_zone' or 'to_zone' set to True, but not both."
-            )
-        else:
-            return values
+    linkage_is_from_zone_xor_to_zone = pydantic.root_validator(allow_reuse=True)(_validate_from_zone_xor_to_zone)
 
 
 class FuelZoneToFuelTransportation(Linkage):
@@ -815,19 +855,7 @@ class FuelZoneToFuelTransportation(Linkage):
     from_zone: bool = False
     to_zone: bool = False
 
-    @pydantic.root_validator
-    def linkage_is_from_zone_xor_to_zone(cls, values):
-        """Validate that exactly one of `from_zone` and `to_zone` is set to True."""
-        if not values["from_zone"] and not values["to_zone"]:
-            raise ValueError(
-                f"{cls.__name__} linkage for {values['name']} must have either 'from_zone' or 'to_zone' set to True."
-            )
-        elif values["from_zone"] and values["to_zone"]:
-            raise ValueError(
-                f"{cls.__name__} linkage for {values['name']} must have either 'from_zone' or 'to_zone' set to True, but not both."
-            )
-        else:
-            return values
+    linkage_is_from_zone_xor_to_zone = pydantic.root_validator(allow_reuse=True)(_validate_from_zone_xor_to_zone)
 
 
 class ZoneToZone(Linkage):
@@ -875,7 +903,6 @@ class FuelTransportationToCandidateFuel(Linkage):
     # None
 
 
-# TODO: Not sure I need to create _instances class attribute every time... In general, there's a lot of boilerplate here.
 # TODO: Need to get the "from" and "to" direction consistent
 
 
@@ -983,6 +1010,17 @@ class AssetToELCC(Linkage):
         return values
 
 
+def _intern_name(name):
+    """Intern a component name so that repeated names share one string object (non-strings are returned as-is)."""
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+# Component types that are expected to share instance names (e.g., a resource is also an asset and a plant)
+_OVERLAPPING_COMPONENT_TYPES = (frozenset({"assets", "resources", "plants"}), frozenset({"assets", "generic_assets"}))
+# If an instance name matches multiple component types, return the first of these found (`assets` as a last resort)
+_COMPONENT_TYPE_PRIORITY = ("resources", "plants", "tx_paths", "assets")
+
+
 def find_component_type(components_dict: dict[str, dict[str, component.Component]], instance_name: str):
     """Try to find the component with the given instance_name.
 
@@ -999,7 +1037,7 @@ def find_component_type(components_dict: dict[str, dict[str, component.Component
     matching_component_types = [
         component_type
         for component_type, component_dict_one_type in components_dict.items()
-        if instance_name in component_dict_one_type.keys()
+        if instance_name in component_dict_one_type
     ]
 
     # Warn if no components found or multiple components found (i.e., components with the same name but different types)
@@ -1007,26 +1045,19 @@ def find_component_type(components_dict: dict[str, dict[str, component.Component
         err = f"{instance_name} not found in System components"
         logger.exception(err)
         return None
-    elif (
-        len(matching_component_types) > 1
-        and set(matching_component_types) != {"assets", "resources", "plants"}
-        and set(matching_component_types) != {"assets", "generic_assets"}
-    ):
+    elif len(matching_component_types) == 1:
+        return matching_component_types[0]
+
+    matching_component_types_set = frozenset(matching_component_types)
+    if matching_component_types_set not in _OVERLAPPING_COMPONENT_TYPES:
         logger.debug(
             f"Multiple System components found with name '{instance_name}' in: {matching_component_types}. Using {matching_component_types[0]}"
         )
 
-    # Hacky way to return `assets` as component type as a last resort
-    if "resources" in matching_component_types:
-        return "resources"
-    if "plants" in matching_component_types:
-        return "plants"
-    if "tx_paths" in matching_component_types:
-        return "tx_paths"
-    if "assets" in matching_component_types:
-        return "assets"
-    else:
-        return matching_component_types[0]
+    for component_type in _COMPONENT_TYPE_PRIORITY:
+        if component_type in matching_component_types_set:
+            return component_type
+    return matching_component_types[0]
 
 
 class DeviceToFinalFuel(Linkage):
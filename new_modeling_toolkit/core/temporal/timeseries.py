@@ -5,6 +5,7 @@ import enum
 import glob
 import json
 import pathlib
+import weakref
 from typing import Dict
 from typing import Optional
 from typing import Union
@@ -27,6 +28,38 @@ from new_modeling_toolkit.core import dir_str
 # Constants
 INIT_SEED = 2021
 STEPS_MAX = 100
+# Hard-coded month-to-season mapping for season-hour timeseries
+MONTH_TO_SEASON = {
+    1: "01",
+    2: "01",
+    3: "03",
+    4: "03",
+    5: "03",
+    6: "06",
+    7: "06",
+    8: "06",
+    9: "09",
+    10: "09",
+    11: "09",
+    12: "01",
+}
+
+
+# Cache of `Timeseries.slice_by_timepoint()` lookup keys for each `rep_periods` frame, keyed by the frame's `id()`.
+# Only a weakref to the frame is held, & its entry is dropped when the frame is garbage-collected (before its id can
+# be re-used by a different frame)
+_TIMEPOINT_KEYS_BY_REP_PERIODS: Dict[int, tuple] = {}
+
+
+def _get_timepoint_keys(rep_periods: pd.DataFrame) -> dict:
+    """Get the (shared) cache of timepoint lookup keys built from the given `rep_periods` frame."""
+    rep_periods_id = id(rep_periods)
+    if rep_periods_id not in _TIMEPOINT_KEYS_BY_REP_PERIODS:
+        _TIMEPOINT_KEYS_BY_REP_PERIODS[rep_periods_id] = (
+            weakref.ref(rep_periods, lambda _: _TIMEPOINT_KEYS_BY_REP_PERIODS.pop(rep_periods_id, None)),
+            {},
+        )
+    return _TIMEPOINT_KEYS_BY_REP_PERIODS[rep_periods_id][1]
 
 
 @enum.unique
@@ -306,6 +339,21 @@ class Timeseries(custom_model.CustomModel):
         Returns: Value of the current TS at the queried (model year, period, hour)
 
         """
+        # The lookup key for each timepoint only depends on the rep periods (not `data`), so it's cached & shared by all
+        # timeseries of the same `weather_year` & `type` (e.g., for each constraint that slices a timeseries).
+        # Weather year keys don't depend on the model year, so they're only cached once per (period, hour)
+        timepoint_keys = _get_timepoint_keys(temporal_settings.rep_periods)
+        if self.weather_year:
+            timepoint = (self.weather_year, self.type, period, hour)
+        else:
+            timepoint = (self.weather_year, self.type, model_year, period, hour)
+        if timepoint not in timepoint_keys:
+            timepoint_keys[timepoint] = self._get_timepoint_key(temporal_settings, model_year, period, hour)
+
+        return self.data_dict[timepoint_keys[timepoint]]
+
+    def _get_timepoint_key(self, temporal_settings, model_year, period, hour):
+        """Get the `data` index value that `slice_by_timepoint()` looks up for the given (model year, period, hour)."""
         # If the timeseries is already a weather year type, we use rep periods directly
         if self.weather_year:
             chrono_dt = temporal_settings.rep_periods.loc[period, hour]
@@ -326,23 +374,53 @@ class Timeseries(custom_model.CustomModel):
         elif self.type == TimeseriesType.MONTH_HOUR:
             chrono_dt = f"{chrono_dt.month:02d}-01 {chrono_dt.hour:02d}:00:00"
         elif self.type == TimeseriesType.SEASON_HOUR:
-            # Hard-code seasons-month mapping
-            month_to_season = {
-                1: "01",
-                2: "01",
-                3: "03",
-                4: "03",
-                5: "03",
-                6: "06",
-                7: "06",
-                8: "06",
-                9: "09",
-                10: "09",
-                11: "09",
-                12: "01",
-            }
-            chrono_dt = f"{month_to_season[chrono_dt.month]}-01 {chrono_dt.hour:02d}:00:00"
-        return self.data_dict[chrono_dt]
+            chrono_dt = f"{MONTH_TO_SEASON[chrono_dt.month]}-01 {chrono_dt.hour:02d}:00:00"
+        return chrono_dt
+
+    def slice_by_timepoints(self, temporal_settings, model_year, periods, hours) -> np.ndarray:
+        """Vectorized version of `slice_by_timepoint()` for all combinations of the given periods & hours.
+
+        The timestamps (or month-hour/season-hour keys) for all timepoints are built at once, and the values are then
+        looked up in a single `.loc` call, rather than calling `slice_by_timepoint()` for each timepoint.
+
+        Args:
+            temporal_settings: Temporal settings with the `rep_periods` to slice by
+            model_year: The year we are trying to model. Doesn't make an impact for renewable profiles
+            periods: Indices of the representative periods we're looking for
+            hours: Hours within the representative periods
+
+        Returns: Values of the current TS, ordered by period and then hour (i.e., like `itertools.product(periods,
+            hours)`)
+
+        """
+        chrono_dts = pd.DatetimeIndex(temporal_settings.rep_periods.loc[list(periods), list(hours)].to_numpy().ravel())
+
+        if not self.weather_year:
+            # Same leap day & model year replacement as `slice_by_timepoint()`
+            is_leap_day = (chrono_dts.month == 2) & (chrono_dts.day == 29)
+            chrono_dts = chrono_dts.where(~is_leap_day, chrono_dts - pd.Timedelta("1D"))
+            chrono_dts = pd.DatetimeIndex(
+                pd.to_datetime(
+                    pd.DataFrame(
+                        {"year": model_year, "month": chrono_dts.month, "day": chrono_dts.day, "hour": chrono_dts.hour}
+                    )
+                )
+            )
+
+        if self.type == TimeseriesType.MONTHLY:
+            chrono_dts = chrono_dts.strftime("%m-01 00:00:00")
+        elif self.type == TimeseriesType.MONTH_HOUR:
+            chrono_dts = chrono_dts.strftime("%m-01 %H:00:00")
+        elif self.type == TimeseriesType.SEASON_HOUR:
+            chrono_dts = chrono_dts.month.map(MONTH_TO_SEASON) + chrono_dts.strftime("-01 %H:00:00")
+
+        # `.loc` returns extra rows for duplicate index values, which would misalign the values with the timepoints. In
+        # that case, look up each key in `data_dict` (like `slice_by_timepoint()`, which keeps the last duplicate)
+        if not self.data.index.is_unique:
+            data_dict = self.data_dict
+            return np.array([data_dict[chrono_dt] for chrono_dt in chrono_dts])
+
+        return self.data.loc[chrono_dts].to_numpy()
 
     def add_leap_day(self, year, interval):
         """
@@ -1,5 +1,7 @@
+import functools
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import pyomo.environ as pyo
 from loguru import logger
@@ -7,52 +9,76 @@ from pyomo import environ as pyo
 
 
 def mark_pyomo_component(func):
-    """Simple timer decorator"""
-    logger.info(f"Constructing {func.__name__!r}")
+    """Log the name of a pyomo component declared via the decorator syntax (e.g., `@model.Constraint(...)`).
+
+    Decorators apply bottom-up, so by the time this runs the pyomo decorator has already constructed the component on
+    the (concrete) model. The rule is returned unwrapped, since pyomo has already stored & called it.
+    """
+    logger.info("Constructing {!r}", func.__name__)
     return func
 
 
-def get_index_labels(model_component: Union[pyo.Param, pyo.Var, pyo.Expression, pyo.Constraint]) -> list[str]:
-    """Get the names of the indices, given a Pyomo model component instance."""
+# Several sets are multi-dimensional, so their index labels are expanded into the names of each dimension
+_MULTI_DIMENSIONAL_SET_LABELS = {
+    # TIMEPOINTS are a tuple of MODEL_YEARS, REP_PERIODS, and HOURS
+    "TIMEPOINTS": ("MODEL_YEARS", "REP_PERIODS", "HOURS"),
+    "MODEL_YEARS_AND_ADJACENT_REP_PERIODS": ("MODEL_YEARS", "PREV_REP_PERIODS", "NEXT_REP_PERIODS"),
+    "MODEL_YEARS_AND_CHRONO_PERIODS": ("MODEL_YEARS", "CHRONO_PERIODS"),
+    "DISPATCH_WINDOWS_AND_TIMESTAMPS": ("DISPATCH_WINDOWS", "TIMESTAMPS"),
+    "RESOURCE_CANDIDATE_FUELS_FOR_EMISSIONS_POLICY": ("EMISSIONS_POLICIES", "RESOURCES", "CANDIDATE_FUELS"),
+    "SIMULTANEOUS_FLOW_GROUPS_MAP": ("SIMULTANEOUS_FLOW_GROUPS", "TRANSMISSION_LINES"),
+    "PLANTS_THAT_INCREMENT_RESERVES": ("PLANTS", "RESERVES"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _expand_index_labels(set_names: tuple[str, ...]) -> tuple[str, ...]:
+    """Expand multi-dimensional set names (cached, since many components are indexed by the same sets)."""
+    return tuple(label for set_name in set_names for label in _MULTI_DIMENSIONAL_SET_LABELS.get(set_name, (set_name,)))
+
+
+# Single (i.e., not implicitly crossed) index sets whose members are tuples, which get a MultiIndex in DataFrames
+_MULTI_DIMENSIONAL_INDEX_SETS = frozenset(
+    {
+        "TIMEPOINTS",
+        "ADJACENT_REP_PERIODS",
+        "DISPATCH_WINDOWS_AND_TIMESTAMPS",
+        "RESOURCE_CANDIDATE_FUELS_FOR_EMISSIONS_POLICY",
+        "SIMULTANEOUS_FLOW_GROUPS_MAP",
+    }
+)
+
+
+def _get_index_labels_and_is_multi(
+    model_component: Union[pyo.Param, pyo.Var, pyo.Expression, pyo.Constraint]
+) -> tuple[list[str], bool]:
+    """Get the names of the indices and whether the component's index should be a MultiIndex (in one pass)."""
     if model_component.is_indexed():
         # If component has multiple indices, we need to do some additional unpacking using _implicit_subsets
         if model_component._implicit_subsets is not None:
-            names = [s.name for s in model_component._implicit_subsets]
+            set_names = tuple(s.name for s in model_component._implicit_subsets)
+            is_multi = True
         else:
-            names = [model_component.index_set().name]
-
-        # Several sets are multi-dimensional, which require yet another (last) unpacking
-        if "TIMEPOINTS" in names:  # TIMEPOINTS are a tuple of MODEL_YEARS, REP_PERIODS, and HOURS
-            tuple_pos = names.index("TIMEPOINTS")
-            names[tuple_pos : tuple_pos + 1] = ("MODEL_YEARS", "REP_PERIODS", "HOURS")
+            set_names = (model_component.index_set().name,)
+            is_multi = set_names[0] in _MULTI_DIMENSIONAL_INDEX_SETS
 
-        if "MODEL_YEARS_AND_ADJACENT_REP_PERIODS" in names:
-            tuple_pos = names.index("MODEL_YEARS_AND_ADJACENT_REP_PERIODS")
-            names[tuple_pos : tuple_pos + 1] = ("MODEL_YEARS", "PREV_REP_PERIODS", "NEXT_REP_PERIODS")
+        names = list(_expand_index_labels(set_names))
+    else:
+        names = [None]
+        is_multi = False
 
-        if "MODEL_YEARS_AND_CHRONO_PERIODS" in names:
-            tuple_pos = names.index("MODEL_YEARS_AND_CHRONO_PERIODS")
-            names[tuple_pos : tuple_pos + 1] = ("MODEL_YEARS", "CHRONO_PERIODS")
+    return names, is_multi
 
-        if "DISPATCH_WINDOWS_AND_TIMESTAMPS" in names:
-            tuple_pos = names.index("DISPATCH_WINDOWS_AND_TIMESTAMPS")
-            names[tuple_pos : tuple_pos + 1] = ("DISPATCH_WINDOWS", "TIMESTAMPS")
 
-        if "RESOURCE_CANDIDATE_FUELS_FOR_EMISSIONS_POLICY" in names:
-            tuple_pos = names.index("RESOURCE_CANDIDATE_FUELS_FOR_EMISSIONS_POLICY")
-            names[tuple_pos : tuple_pos + 1] = ("EMISSIONS_POLICIES", "RESOURCES", "CANDIDATE_FUELS")
+def get_index_labels(model_component: Union[pyo.Param, pyo.Var, pyo.Expression, pyo.Constraint]) -> list[str]:
+    """Get the names of the indices, given a Pyomo model component instance."""
+    names, _ = _get_index_labels_and_is_multi(model_component)
 
-        if "SIMULTANEOUS_FLOW_GROUPS_MAP" in names:
-            tuple_pos = names.index("SIMULTANEOUS_FLOW_GROUPS_MAP")
-            names[tuple_pos : tuple_pos + 1] = ("SIMULTANEOUS_FLOW_GROUPS", "TRANSMISSION_LINES")
+    return names
 
-        if "PLANTS_THAT_INCREMENT_RESERVES" in names:
-            tuple_pos = names.index("PLANTS_THAT_INCREMENT_RESERVES")
-            names[tuple_pos : tuple_pos + 1] = ("PLANTS", "RESERVES")
-    else:
-        names = [None]
 
-    return names
+# Constraints whose full expression is also saved when converted to a DataFrame
+_CONSTRAINTS_TO_PRINT_EXPR = frozenset({"Rep_Period_Energy_Budget_Constraint"})
 
 
 def convert_pyomo_object_to_dataframe(
@@ -76,24 +102,21 @@ def convert_pyomo_object_to_dataframe(
     """
     if isinstance(model_component, (pyo.Param, pyo.Var, pyo.Expression)):
         # Get model component results as a dict using extract_values() method
-        obj_results = {
-            idx: pyo.value(v, exception=exception) if not isinstance(v, tuple) else str(v)
-            for idx, v in model_component.extract_values().items()
-        }
-        # TODO (2022-02-22): We could make the `get_index_labels` function do get both names and the entire index object.
+        obj_results = model_component.extract_values()
+        if isinstance(model_component, pyo.Expression):
+            # Only Expressions need to be evaluated; Var & Param values are already plain Python objects
+            obj_results = {idx: pyo.value(v, exception=exception) for idx, v in obj_results.items()}
+        elif isinstance(model_component, pyo.Param):
+            # Some Params (e.g., `first_timepoint_of_period`) hold tuples, which are saved as strings
+            obj_results = {idx: str(v) if isinstance(v, tuple) else v for idx, v in obj_results.items()}
         if model_component.is_indexed():
-            names = get_index_labels(model_component)
-            if model_component._implicit_subsets is not None or model_component.index_set().name in [
-                "TIMEPOINTS",
-                "ADJACENT_REP_PERIODS",
-                "DISPATCH_WINDOWS_AND_TIMESTAMPS",
-                "RESOURCE_CANDIDATE_FUELS_FOR_EMISSIONS_POLICY",
-                "SIMULTANEOUS_FLOW_GROUPS_MAP",
-            ]:
+            names, is_multi = _get_index_labels_and_is_multi(model_component)
+            if is_multi:
                 if len(obj_results.keys()) == 0:
                     index = pd.MultiIndex.from_tuples([(None,) * len(names)], names=names)
                 else:
-                    index = pd.MultiIndex.from_tuples(obj_results.keys(), names=names)
+                    # Transpose index tuples into one array per level, which is cheaper than `from_tuples`
+                    index = pd.MultiIndex.from_arrays(list(zip(*obj_results.keys())), names=names)
             else:
                 index = pd.Index(obj_results.keys(), name=names[0])
         else:
@@ -102,32 +125,57 @@ def convert_pyomo_object_to_dataframe(
         # Create dataframe from dict
         df = pd.DataFrame(obj_results.values(), index=index, columns=[model_component.name])
     elif isinstance(model_component, pyo.Constraint):
+        # Look up the dual Suffix once, rather than resolving it by name for every constraint
+        dual_suffix = model_component.model().component("dual")
+        if dual_suffix is None:
+            dual_suffix = {}
+
+        # Fill preallocated float arrays (missing values stay NaN), rather than building a dict-of-dicts that pandas has
+        # to re-infer column dtypes for
+        keys = list(model_component.keys())
+        constraints = list(model_component.values())
+        duals = np.full(len(constraints), np.nan)
+        for i, constraint in enumerate(constraints):
+            if (dual := dual_suffix.get(constraint)) is not None:
+                duals[i] = dual
+        if keys and isinstance(keys[0], tuple):
+            index = pd.MultiIndex.from_tuples(keys)
+        else:
+            index = pd.Index(keys)
+
         if dual_only:
-            df = pd.DataFrame.from_dict(
-                {idx: {"Dual": model_component[idx].get_suffix_value("dual")} for idx in model_component},
-                orient="index",
-            )
+            df = pd.DataFrame({"Dual": duals}, index=index)
         else:
-            constraints_to_print_expr = [
-                "Rep_Period_Energy_Budget_Constraint",
-            ]
-            df = pd.DataFrame.from_dict(
+            lower_bounds = np.full(len(constraints), np.nan)
+            bodies = np.full(len(constraints), np.nan)
+            upper_bounds = np.full(len(constraints), np.nan)
+            for i, constraint in enumerate(constraints):
+                # One-sided constraints have no expression for the other bound, so don't evaluate it
+                if (lower := constraint.lower) is not None:
+                    lower_bounds[i] = pyo.value(lower)
+                if (body := pyo.value(constraint.body)) is not None:
+                    bodies[i] = body
+                if (upper := constraint.upper) is not None:
+                    upper_bounds[i] = pyo.value(upper)
+
+            # Only a few constraints save their full expression, so fetch `.expr` for those alone
+            if model_component.name in _CONSTRAINTS_TO_PRINT_EXPR:
+                expressions = [constraint.expr for constraint in constraints]
+            else:
+                expressions = [None] * len(constraints)
+
+            df = pd.DataFrame(
                 {
-                    idx: {
-                        "Lower Bound": pyo.value(model_component[idx].lower),
-                        "Body": pyo.value(model_component[idx].body),
-                        "Upper Bound": pyo.value(model_component[idx].upper),
-                        "Dual": model_component[idx].get_suffix_value("dual"),
-                        "Expression": (
-                            model_component[idx].expr if model_component.name in constraints_to_print_expr else None
-                        ),
-                    }
-                    for idx in model_component
+                    "Lower Bound": lower_bounds,
+                    "Body": bodies,
+                    "Upper Bound": upper_bounds,
+                    "Dual": duals,
+                    "Expression": expressions,
                 },
-                orient="index",
+                index=index,
             )
         # TODO (2022-02-22): The way the index is created and named for constraints vs. other model components seems
-        #  like could be made to be the same (related to previous TODO)
+        #  like could be made to be the same
         index_names = get_index_labels(model_component)
         # If DataFrame is empty, need an extra step to be able to label the index headers
         if df.empty:
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import shutil
 import time
@@ -43,6 +44,11 @@ class DirStructure:
             model_name (str): specific name of the model.
         """
         self._data_folder = data_folder
+        # Directories already created by `make_directories()`, so repeated calls only create newly-defined directories
+        self._created_dirs = set()
+        # (Modification time, names of the files) of the RESOLVE case's `extras` folder, cached by
+        # `get_resolve_settings_extras_files()`
+        self._resolve_settings_extras_files = None
 
         self.model_name = model_name
         self.code_dir = code_dir
@@ -84,8 +90,9 @@ class DirStructure:
 
     def make_directories(self):
         for path in vars(self).values():
-            if isinstance(path, pathlib.Path):
+            if isinstance(path, pathlib.Path) and path not in self._created_dirs:
                 path.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(path)
 
     def make_simplified_emissions_module_dir(self, simplified_emissions_module_settings_name):
         timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
@@ -113,6 +120,7 @@ class DirStructure:
         self.resolve_settings_dir = self.data_settings_dir / "resolve" / resolve_settings_name
         self.resolve_settings_rep_periods_dir = self.resolve_settings_dir / "temporal_settings"
         self.resolve_settings_custom_constraints_dir = self.resolve_settings_dir / "custom_constraints"
+        self._resolve_settings_extras_files = None
 
         # resolve output file location
         self.output_resolve_dir = self.results_dir / "resolve" / f"{resolve_settings_name}" / f"{timestamp}"
@@ -137,6 +145,28 @@ class DirStructure:
         # make these directories if they do not already exist
         self.make_directories()
 
+    def get_resolve_settings_extras_files(self) -> set[str]:
+        """Get the names of the files in the RESOLVE case's `extras` settings folder.
+
+        The folder listing is cached & keyed on the folder's modification time (which changes whenever a file is added,
+        removed or renamed), so checking for optional "extras" inputs only needs one `stat()` call rather than a
+        listing (or an `exists()` call for each file).
+
+        Returns:
+            extras_files: names of the files in the `extras` folder (empty if the folder doesn't exist)
+        """
+        extras_dir = self.resolve_settings_dir / "extras"
+        try:
+            mtime_ns = extras_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return set()
+
+        if self._resolve_settings_extras_files is None or self._resolve_settings_extras_files[0] != mtime_ns:
+            with os.scandir(extras_dir) as entries:
+                self._resolve_settings_extras_files = (mtime_ns, {entry.name for entry in entries if entry.is_file()})
+
+        return self._resolve_settings_extras_files[1]
+
     def make_reclaim_dir(self, reclaim_config_name):
         # reclaim config name
         timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
@@ -164,6 +194,7 @@ class DirStructure:
         # clear all contents in the log directory
         if self.reclaim_logs_dir.exists():
             shutil.rmtree(self.reclaim_logs_dir)
+            self._created_dirs.discard(self.reclaim_logs_dir)
 
         # make these directories if they do not already exist
         self.make_directories()
@@ -200,9 +231,24 @@ class DirStructure:
 
         """
         results_path = self.results_dir / model
-
-        # Get all RESOLVE results folder names (nested list to make it "tall" instead of "wide"
-        paths = ["/".join(p.parts[-3:-1]) for p in results_path.glob("**/results_summary") if any(p.iterdir())]
+        if not results_path.is_dir():
+            return []
+
+        # Results are saved in `[model]/[case name]/[timestamp]/results_summary`, so only scan those two levels (rather
+        # than recursively globbing every results file) and stop at the first entry found in each `results_summary`
+        paths = []
+        with os.scandir(results_path) as cases:
+            for case in cases:
+                if not case.is_dir():
+                    continue
+                with os.scandir(case.path) as timestamps:
+                    for timestamp in timestamps:
+                        results_summary_path = os.path.join(timestamp.path, "results_summary")
+                        if not os.path.isdir(results_summary_path):
+                            continue
+                        with os.scandir(results_summary_path) as results_summary:
+                            if next(results_summary, None) is not None:
+                                paths.append(f"{case.name}/{timestamp.name}")
 
         return paths
 
@@ -1,6 +1,10 @@
-import re
+import concurrent.futures
+import contextlib
+import pathlib
 import shutil
 import sys
+import threading
+import zipfile
 
 import pandas as pd
 import pyomo.environ as pyo
@@ -75,70 +79,134 @@ def _export_scaled_load_components(resolve_case: ResolveCase, raw_results: bool
             ).round(3).to_csv(scaled_load_results_folder / f"{load_component.name}.csv", index=True)
 
 
+# Number of threads writing results CSVs while the next components are extracted from the model
+_RESULTS_WRITER_THREADS = 4
+# Maximum number of results DataFrames waiting to be (or being) written, which bounds the memory held by the writers
+_MAX_PENDING_RESULTS_WRITES = 2 * _RESULTS_WRITER_THREADS
+
+
+def _write_results_to_archive(df: pd.DataFrame, archive: zipfile.ZipFile, arcname: str, lock: threading.Lock):
+    """Write a results DataFrame (including its index) as a CSV member of a zip archive shared by the writer threads."""
+    csv_text = df.to_csv(index=True)
+    with lock:
+        archive.writestr(arcname, csv_text)
+
+
 @timer
-def _export_model_results(resolve_case: ResolveCase, raw_results: bool = False):
-    """Loops through ResolveModel components and saves to CSV."""
+def _export_model_results(resolve_case: ResolveCase, raw_results: bool = False, archive_results: bool = False):
+    """Loops through ResolveModel components and saves to CSV.
+
+    If `archive_results` is True, the CSVs are written into a single `raw_results.zip` in the RESOLVE output folder
+    (using the same relative paths as the individual files), rather than as hundreds of small files.
+    """
 
     # Get object type dictionary
     object_type_dict = get_object_type_dict(resolve_case)
+    output_resolve_dir = resolve_case.dir_structure.output_resolve_dir
 
-    # Write out "raw" results
-    for obj_type in object_type_dict.keys():
-        if raw_results:
-            components_to_print = list(
-                resolve_case.model.component_objects(object_type_dict[obj_type]["object"], active=True)
+    writes = []
+    created_block_dirs = set()
+    archive_lock = threading.Lock()
+    pending_writes = threading.BoundedSemaphore(_MAX_PENDING_RESULTS_WRITES)
+
+    if raw_results:
+        # Walk the model's component tree once (rather than once per object type) and bucket components by type
+        components_by_ctype = {obj_type_info["object"]: [] for obj_type_info in object_type_dict.values()}
+        for component in resolve_case.model.component_objects(list(components_by_ctype.keys()), active=True):
+            components_by_ctype[component.ctype].append(component)
+
+    with contextlib.ExitStack() as stack:
+        archive = (
+            stack.enter_context(
+                zipfile.ZipFile(output_resolve_dir / "raw_results.zip", "w", compression=zipfile.ZIP_DEFLATED)
             )
-        else:
-            # BAND-AID: Always report some "raw" results
-            always_report = {
-                "Variable": [
-                    resolve_case.model.ELCC_MW,
-                    resolve_case.model.Custom_Constraint_Slack_Up,
-                    resolve_case.model.Custom_Constraint_Slack_Down,
-                    resolve_case.model.Policy_Slack,
-                    resolve_case.model.Resource_Potential_Slack,
-                    resolve_case.model.SOC_Inter_Period,
-                ],
-                "Expression": [resolve_case.model.ELCC_Facet_Value],
-                "Constraint": [
-                    resolve_case.model.Custom_Constraint,
-                    resolve_case.model.ELCC_Facet_Constraint_LHS,
-                ],
-                "Parameter": [],
-                "Set": [],
-            }
-            components_to_print = always_report[obj_type]
-
-        for obj in tqdm(
-            components_to_print,
-            desc=f"Printing {obj_type} results:".ljust(48),
-            bar_format="{l_bar}{bar:30}{r_bar}{bar:-10b}",
-        ):
-            df = convert_pyomo_object_to_dataframe(obj)
-            logger.debug(f"{obj}: {sys.getsizeof(obj)} bytes")
-
-            if df is not None:
+            if archive_results
+            else None
+        )
+        # Write CSVs on a small thread pool, so that file I/O overlaps with extracting results for the next component
+        # from the pyomo model on the main thread. The pool is entered after the archive, so that all writes finish
+        # before the archive is closed
+        executor = stack.enter_context(concurrent.futures.ThreadPoolExecutor(max_workers=_RESULTS_WRITER_THREADS))
+
+        def write_results(df: pd.DataFrame, path: pathlib.Path):
+            # Block until a writer frees up a slot, so that the main thread can't queue up every DataFrame in memory
+            pending_writes.acquire()
+            if archive is None:
+                write = executor.submit(df.to_csv, path, index=True)
+            else:
+                arcname = path.relative_to(output_resolve_dir).as_posix()
+                write = executor.submit(_write_results_to_archive, df, archive, arcname, archive_lock)
+            write.add_done_callback(lambda _: pending_writes.release())
+            writes.append(write)
+
+        # Write out "raw" results
+        for obj_type in object_type_dict.keys():
+            if raw_results:
+                components_to_print = components_by_ctype[object_type_dict[obj_type]["object"]]
+            else:
+                # BAND-AID: Always report some "raw" results
+                always_report = {
+                    "Variable": [
+                        resolve_case.model.ELCC_MW,
+                        resolve_case.model.Custom_Constraint_Slack_Up,
+                        resolve_case.model.Custom_Constraint_Slack_Down,
+                        resolve_case.model.Policy_Slack,
+                        resolve_case.model.Resource_Potential_Slack,
+                        resolve_case.model.SOC_Inter_Period,
+                    ],
+                    "Expression": [resolve_case.model.ELCC_Facet_Value],
+                    "Constraint": [
+                        resolve_case.model.Custom_Constraint,
+                        resolve_case.model.ELCC_Facet_Constraint_LHS,
+                    ],
+                    "Parameter": [],
+                    "Set": [],
+                }
+                components_to_print = always_report[obj_type]
+
+            for obj in tqdm(
+                components_to_print,
+                desc=f"Printing {obj_type} results:".ljust(48),
+                bar_format="{l_bar}{bar:30}{r_bar}{bar:-10b}",
+                # Most components export quickly, so batch progress bar redraws
+                mininterval=0.5,
+                miniters=10,
+            ):
+                df = convert_pyomo_object_to_dataframe(obj)
+                logger.debug(f"{obj}: {sys.getsizeof(obj)} bytes")
+                if df is None:
+                    continue
+
+                # Clean up results once (reused for the block subfolder copy below). Empty results are still written
+                # (as header-only CSVs), since e.g. the Excel results viewer only refreshes sheets whose CSV exists
+                df = df.dropna(axis=0, how="all").round(3)
+                # Most components are already extracted in index order, so only sort (in place) when needed
+                if not df.index.is_monotonic_increasing:
+                    df.sort_index(inplace=True)
+
                 # Write out df
-                df.dropna(axis=0, how="all").round(3).sort_index().to_csv(
-                    object_type_dict[obj_type]["output_dir"] / f"{obj.name}.csv", index=True
-                )
-                # For block-based components, save them in a subfolder of the block's name instead of by component type
+                output_path = object_type_dict[obj_type]["output_dir"] / f"{obj.name}.csv"
+                write_results(df, output_path)
+                # For block-based components, also save them in a subfolder of the block's name
                 if "blocks" in obj.name:
-                    block_name = re.search("(?<=\[)(.*?)(?=\])", obj.name).group(1)
-                    (resolve_case.dir_structure.output_resolve_dir / "raw" / block_name).mkdir(
-                        exist_ok=True, parents=True
-                    )
+                    # Block name is between the brackets of the component name (e.g., `blocks[name].component`)
+                    block_name = obj.name[obj.name.index("[") + 1 : obj.name.index("]")]
+                    block_dir = output_resolve_dir / "raw" / block_name
+                    if archive is None and block_dir not in created_block_dirs:
+                        block_dir.mkdir(exist_ok=True, parents=True)
+                        created_block_dirs.add(block_dir)
 
                     component_name = obj.name.split(".")[-1]
-                    df.dropna(axis=0, how="all").round(3).sort_index().to_csv(
-                        resolve_case.dir_structure.output_resolve_dir / "raw" / block_name / f"{component_name}.csv",
-                        index=True,
-                    )
+                    write_results(df, block_dir / f"{component_name}.csv")
+
+        # Re-raise any errors from writing CSVs
+        for write in writes:
+            write.result()
 
     logger.info("***Done outputting model results***")
 
 
-def export_results(resolve_case: ResolveCase, raw_results: bool = False):
+def export_results(resolve_case: ResolveCase, raw_results: bool = False, archive_results: bool = False):
     _export_temporal_settings(dir_str=resolve_case.dir_structure)
-    _export_model_results(resolve_case=resolve_case, raw_results=raw_results)
+    _export_model_results(resolve_case=resolve_case, raw_results=raw_results, archive_results=archive_results)
     _export_scaled_load_components(resolve_case=resolve_case, raw_results=raw_results)
@@ -1,10 +1,15 @@
+import functools
+import operator
 import os
+import pathlib
 from dataclasses import dataclass
+from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -165,6 +170,9 @@ TRANSMISSION_SUMMARY_FILENAME = "transmission_summary.csv"
 ZONAL_PRICE_SUMMARY_FILENAME = "zonal_price_summary.csv"
 ZONAL_SUMMARY_FILENAME = "zonal_summary.csv"
 
+# Number of rows formatted at a time when writing output summary CSV files
+_CSV_CHUNK_SIZE = 50_000
+
 # Define column names for index columns in output CSV summary files.
 ASSET = "Asset"
 FUEL_CONVERSION_PLANT = "Fuel Conversion Plant"
@@ -185,9 +193,13 @@ ZONE_TO = "Zone To"
 
 @dataclass
 class FileConfig:
-    """Helper class to store data for each output summary CSV file"""
+    """Helper class to store data for each output summary CSV file
+
+    The Components for each file are looked up from the ResolveCase (via `get_component_dict`) when the file is
+    written, so that the configs themselves can be defined once at the module level.
+    """
 
-    component_dict: Dict[str, Component]
+    get_component_dict: Callable[[ResolveCase], Dict[str, Component]]
     column_attribute_mapping: Dict[str, str]
     index_names: Tuple[str, ...]
     attributes_are_timeseries: bool
@@ -198,6 +210,180 @@ class FileConfig:
     index_levels_convert_to_datetime: Optional[Union[str, list[str, ...]]] = None
 
 
+def _get_other_electric_assets(resolve_case: ResolveCase) -> Dict[str, Component]:
+    """Get the electric assets that are neither resources nor transmission paths (which have their own summaries)."""
+    resources = resolve_case.system.resources
+    tx_paths = resolve_case.system.tx_paths
+
+    return {
+        asset_name: asset
+        for asset_name, asset in resolve_case.system.electric_assets.items()
+        if asset_name not in resources and asset_name not in tx_paths
+    }
+
+
+def _get_policies_of_type(resolve_case: ResolveCase, policy_type: str) -> Dict[str, Component]:
+    """Get the policies of the given type (e.g., "emissions")."""
+    return {
+        policy_name: policy
+        for policy_name, policy in resolve_case.system.policies.items()
+        if policy.type == policy_type
+    }
+
+
+# Define the output summary CSV files that are created from Component attributes.
+_FILE_CONFIGS = (
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.resources"),
+        column_attribute_mapping=_RESOURCE_ATTRIBUTE_COLUMN_MAPPING,
+        add_electric_zone_to_index=True,
+        index_names=(RESOURCE, ZONE, MODEL_YEAR),
+        attributes_are_timeseries=True,
+        index_levels_convert_to_datetime=None,
+        filename=RESOURCE_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.resources"),
+        column_attribute_mapping=_RESOURCE_DISPATCH_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=True,
+        index_names=(RESOURCE, ZONE, MODEL_YEAR, "Rep_Period", "Hour"),
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=RESOURCE_DISPATCH_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.resources"),
+        column_attribute_mapping=_FUEL_BURN_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=True,
+        index_names=(RESOURCE, ZONE, FUEL, MODEL_YEAR),
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=RESOURCE_FUEL_BURN_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=_get_other_electric_assets,
+        column_attribute_mapping=_ASSET_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=True,
+        add_electric_zone_to_index=False,
+        index_names=(ASSET, MODEL_YEAR),
+        index_levels_convert_to_datetime=None,
+        filename=ASSET_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.zones"),
+        column_attribute_mapping=_ZONAL_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=True,
+        add_electric_zone_to_index=False,
+        index_names=(ZONE, MODEL_YEAR),
+        index_levels_convert_to_datetime=None,
+        filename=ZONAL_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.zones"),
+        column_attribute_mapping=_ZONAL_PRICE_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=False,
+        index_names=(ZONE, MODEL_YEAR, "Rep Period", "Hour"),
+        index_levels_convert_to_datetime=None,
+        filename=ZONAL_PRICE_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.tx_paths"),
+        column_attribute_mapping=_TRANSMISSION_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=True,
+        add_electric_zone_to_index=False,
+        index_names=(TRANSMISSION_PATH, MODEL_YEAR),
+        index_levels_convert_to_datetime=None,
+        filename=TRANSMISSION_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.policies"),
+        column_attribute_mapping=_POLICY_DUALS_ATTRIBUTE_COLUMN_MAPPING,
+        add_electric_zone_to_index=False,
+        index_names=(POLICY, MODEL_YEAR),
+        attributes_are_timeseries=True,
+        index_levels_convert_to_datetime=None,
+        filename=POLICY_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=functools.partial(_get_policies_of_type, policy_type="energy"),
+        column_attribute_mapping=_ENERGY_POLICY_ATTRIBUTE_COLUMN_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=False,
+        index_names=(POLICY, RESOURCE, MODEL_YEAR),
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=ENERGY_POLICY_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=functools.partial(_get_policies_of_type, policy_type="emissions"),
+        column_attribute_mapping=_EMISSIONS_POLICY_RESOURCE_COLUMN_ATTRIBUTE_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=False,
+        index_names=(POLICY, RESOURCE, MODEL_YEAR),
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=EMISSIONS_POLICY_RESOURCE_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=functools.partial(_get_policies_of_type, policy_type="emissions"),
+        column_attribute_mapping=_EMISSIONS_POLICY_TX_PATH_COLUMN_ATTRIBUTE_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=False,
+        index_names=(POLICY, TRANSMISSION_PATH, MODEL_YEAR),
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=EMISSIONS_POLICY_TX_PATH_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=functools.partial(_get_policies_of_type, policy_type="prm"),
+        column_attribute_mapping=_PRM_POLICY_RESOURCE_SUMMARY_COLUMN_ATTRIBUTE_MAPPING,
+        attributes_are_timeseries=False,
+        add_electric_zone_to_index=False,
+        index_names=(POLICY, RESOURCE, MODEL_YEAR),
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=PRM_POLICY_RESOURCE_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.electrolyzers"),
+        column_attribute_mapping=_ELECTROLYZER_COLUMN_ATTRIBUTE_MAPPING,
+        index_names=(ELECTROLYZER, ZONE, FUEL_ZONE, MODEL_YEAR),
+        add_electric_zone_to_index=True,
+        add_fuel_zone_to_index=True,
+        attributes_are_timeseries=True,
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=ELECTROLYZER_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.fuel_storages"),
+        column_attribute_mapping=_FUEL_STORAGE_COLUMN_ATTRIBUTE_MAPPING,
+        index_names=(FUEL_STORAGE, ZONE, FUEL_ZONE, MODEL_YEAR),
+        add_electric_zone_to_index=True,
+        add_fuel_zone_to_index=True,
+        attributes_are_timeseries=True,
+        index_levels_convert_to_datetime=None,
+        filename=FUEL_STORAGE_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.fuel_transportations"),
+        column_attribute_mapping=_FUEL_TRANSPORTATION_ATTRIBUTE_COLUMN_MAPPING,
+        index_names=(FUEL_TRANSPORTATION, MODEL_YEAR),
+        add_electric_zone_to_index=False,
+        add_fuel_zone_to_index=False,
+        attributes_are_timeseries=True,
+        index_levels_convert_to_datetime=None,
+        filename=FUEL_TRANSPORTATION_SUMMARY_FILENAME,
+    ),
+    FileConfig(
+        get_component_dict=operator.attrgetter("system.fuel_conversion_plants"),
+        column_attribute_mapping=_FUEL_CONVERSION_PLANT_ATTRIBUTE_COLUMN_MAPPING,
+        index_names=(FUEL_CONVERSION_PLANT, ZONE, FUEL_ZONE, MODEL_YEAR),
+        attributes_are_timeseries=True,
+        add_electric_zone_to_index=True,
+        add_fuel_zone_to_index=True,
+        index_levels_convert_to_datetime=MODEL_YEAR,
+        filename=FUEL_CONVERSION_PLANT_SUMMARY_FILENAME,
+    ),
+)
+
+
 def _create_attribute_df(
     component_dict: Dict[str, Component],
     column_attribute_mapping: Dict[str, str],
@@ -220,47 +406,52 @@ def _create_attribute_df(
     Returns:
         component_data: the DataFrame containing data from the attributes of all Components
     """
-    component_dfs = {}
-    for component_name, component in component_dict.items():
-        curr_component_data = {
-            column_name: (
-                getattr(component, attribute).data if attributes_are_timeseries else getattr(component, attribute)
-            )
-            for column_name, attribute in column_attribute_mapping.items()
-            if getattr(component, attribute) is not None
-        }
-        if len(curr_component_data) > 0:
-            # Extract the attributes for the current Component
-            curr_component_df = pd.concat(curr_component_data, axis=1)
+    column_names = list(column_attribute_mapping)
+    if not component_dict:
+        return pd.DataFrame(columns=column_names, index=pd.MultiIndex.from_tuples([], names=index_names))
 
-        else:
-            curr_component_df = pd.DataFrame(columns=list(column_attribute_mapping.keys()))
+    column_attribute_items = tuple(column_attribute_mapping.items())
+
+    # Collect each Component's DataFrame & index key, so that all Components are combined with a single concat
+    component_dfs = []
+    component_keys = []
+    for component_name, component in component_dict.items():
+        curr_component_data = {}
+        for column_name, attribute in column_attribute_items:
+            # Look up each attribute once, since some are (potentially expensive) properties
+            value = getattr(component, attribute)
+            if value is not None:
+                curr_component_data[column_name] = value.data if attributes_are_timeseries else value
+        if len(curr_component_data) == 0:
+            # Components without any of the attributes don't contribute any rows
+            continue
+
+        # Extract the attributes for the current Component
+        curr_component_df = pd.concat(curr_component_data, axis=1, sort=False, copy=False)
 
         # Append the zone of the Component to the index for output
         component_key = [component_name]
         if add_electric_zone_to_index:
-            electric_zone = list(component.zones.keys())[0] if component.zones else None
+            electric_zone = next(iter(component.zones), None) if component.zones else None
             component_key.append(electric_zone)
         if add_fuel_zone_to_index:
-            fuel_zone = list(component.fuel_zones.keys())[0] if component.fuel_zones else None
+            fuel_zone = next(iter(component.fuel_zones), None) if component.fuel_zones else None
             component_key.append(fuel_zone)
 
-        component_dfs[tuple(component_key)] = curr_component_df
+        component_dfs.append(curr_component_df)
+        component_keys.append(tuple(component_key))
 
     # Combine the data from all Components
     if len(component_dfs) > 0:
-        component_data = pd.concat(component_dfs, axis=0)
+        component_data = pd.concat(component_dfs, axis=0, keys=component_keys, sort=False, copy=False)
 
         # Ensure that all output columns are present, even if the attributes are None for all Components
-        component_data = component_data.reindex(
-            columns=list(column_attribute_mapping.keys()),
-        )
+        component_data = component_data.reindex(columns=column_names, copy=False)
 
-        component_data = component_data.rename_axis(index=index_names)
+        # Name the index levels in place (the frame was just created here), since `rename_axis()` copies the data
+        component_data.index = component_data.index.set_names(index_names)
     else:
-        component_data = pd.DataFrame(
-            columns=list(column_attribute_mapping.keys()), index=pd.MultiIndex.from_tuples([], names=index_names)
-        )
+        component_data = pd.DataFrame(columns=column_names, index=pd.MultiIndex.from_tuples([], names=index_names))
 
     return component_data
 
@@ -279,10 +470,9 @@ def _reindex_to_modeled_years(df: pd.DataFrame, temporal_settings: TemporalSetti
     Returns:
         reindexed_df: the input dataframe with non-modeled years removed
     """
-    modeled_years_index = temporal_settings.modeled_years.data.loc[temporal_settings.modeled_years.data].index.rename(
-        MODEL_YEAR
-    )
-    reindexed_df = df.reindex(modeled_years_index, level=MODEL_YEAR)
+    modeled_years_index = temporal_settings.modeled_years.data.loc[temporal_settings.modeled_years.data].index
+    # Only rows need to be dropped (no rows are added), so filter with a mask rather than aligning with `reindex()`
+    reindexed_df = df.loc[df.index.get_level_values(MODEL_YEAR).isin(modeled_years_index)]
 
     return reindexed_df
 
@@ -302,296 +492,191 @@ def _create_temporal_settings_summary(resolve_case: ResolveCase) -> pd.DataFrame
     return temporal_settings_summary
 
 
+def _build_zone_lookup(component_dict: Dict[str, Component], index_name: str) -> pd.DataFrame:
+    """Creates a DataFrame of the "from" and "to" zones of path-like Components (e.g., transmission paths).
+
+    Args:
+        component_dict: dictionary containing Component names as keys and Component objects (with `from_zone` and
+            `to_zone` linkages) as values
+        index_name: name for the resulting row index
+
+    Returns:
+        zone_names: the DataFrame with the names of each Component's "from" and "to" zones
+    """
+    from_zones = [component.from_zone._instance_from.name for component in component_dict.values()]
+    to_zones = [component.to_zone._instance_from.name for component in component_dict.values()]
+
+    return pd.DataFrame(
+        {ZONE_FROM: from_zones, ZONE_TO: to_zones}, index=pd.Index(list(component_dict.keys()), name=index_name)
+    )
+
+
+def _add_zones_to_index(index: pd.MultiIndex, zone_names: pd.DataFrame, level: str) -> pd.MultiIndex:
+    """Inserts the "from" and "to" zones of path-like Components into a (Component, Model Year) index.
+
+    Builds the new index directly from the level values, rather than joining the zones as columns and then moving them
+    into the index.
+
+    Args:
+        index: the (Component, Model Year) index of a summary DataFrame
+        zone_names: the DataFrame of zone names from `_build_zone_lookup()`
+        level: name of the index level with the Component names
+
+    Returns:
+        zone_index: the (Component, Zone From, Zone To, Model Year) index
+    """
+    component_names = index.get_level_values(level)
+
+    return pd.MultiIndex.from_arrays(
+        [
+            component_names,
+            component_names.map(zone_names[ZONE_FROM]),
+            component_names.map(zone_names[ZONE_TO]),
+            index.get_level_values(MODEL_YEAR),
+        ],
+        names=[level, ZONE_FROM, ZONE_TO, MODEL_YEAR],
+    )
+
+
+def _map_index_level(index: pd.MultiIndex, level: str, mapping: Union[dict, pd.Series]) -> np.ndarray:
+    """Look up a float value for each row of a MultiIndex from a mapping of the values of one of its levels.
+
+    Only the level's unique values are mapped; the result is then taken positionally using the level's codes.
+    Values missing from `mapping` are NaN.
+    """
+    level_number = index.names.index(level)
+
+    return index.levels[level_number].map(mapping).to_numpy(dtype=float)[index.codes[level_number]]
+
+
+def _write_summary_file(df: pd.DataFrame, path: pathlib.Path, fmt: str = "csv", decimals: Optional[int] = None):
+    """Write a summary DataFrame (including its index) to CSV or Parquet.
+
+    CSVs are written in chunks of rows. Parquet files are written with the `pyarrow` engine next to where the CSV would
+    be (i.e., with a `.parquet` suffix instead of `.csv`).
+
+    Args:
+        df: the summary DataFrame to write
+        path: path of the output CSV file
+        fmt: output file format, either "csv" or "parquet"
+        decimals: number of decimal places to round values to (with `DataFrame.round()`, so e.g. 1.5 is still written
+            as `1.5` rather than a fixed-width `1.500`)
+    """
+    if decimals is not None:
+        df = df.round(decimals)
+
+    if fmt == "csv":
+        df.to_csv(path, index=True, chunksize=_CSV_CHUNK_SIZE)
+    elif fmt == "parquet":
+        df.to_parquet(path.with_suffix(".parquet"), engine="pyarrow", compression="zstd", index=True)
+    else:
+        raise ValueError(f"Unsupported results summary file format: {fmt!r} (expected 'csv' or 'parquet')")
+
+
+def _export_summary_file(config: FileConfig, resolve_case: ResolveCase, output_dir: pathlib.Path, fmt: str = "csv"):
+    """Create and write the output summary file described by `config`."""
+    # Create the summary dataframe
+    logger.info(f"Saving {config.filename}")
+    summary_frame = _create_attribute_df(
+        component_dict=config.get_component_dict(resolve_case),
+        column_attribute_mapping=config.column_attribute_mapping,
+        add_electric_zone_to_index=config.add_electric_zone_to_index,
+        add_fuel_zone_to_index=config.add_fuel_zone_to_index,
+        index_names=config.index_names,
+        attributes_are_timeseries=config.attributes_are_timeseries,
+    )
+
+    # Add the "to" and "from" zones for transmission lines to the index for output
+    if config.filename == TRANSMISSION_SUMMARY_FILENAME:
+        if len(summary_frame) > 0:
+            zone_names = _build_zone_lookup(resolve_case.system.tx_paths, index_name=TRANSMISSION_PATH)
+
+            summary_frame.index = _add_zones_to_index(
+                summary_frame.index, zone_names=zone_names, level=TRANSMISSION_PATH
+            )
+        else:
+            summary_frame.index = pd.MultiIndex.from_tuples(
+                [], names=[TRANSMISSION_PATH, ZONE_FROM, ZONE_TO, MODEL_YEAR]
+            )
+
+    # Add the "to" and "from" zones for the fuel transportation component to the index for output
+    if config.filename == FUEL_TRANSPORTATION_SUMMARY_FILENAME:
+        if len(summary_frame) > 0:
+            zone_names = _build_zone_lookup(resolve_case.system.fuel_transportations, index_name=FUEL_TRANSPORTATION)
+
+            summary_frame.index = _add_zones_to_index(
+                summary_frame.index, zone_names=zone_names, level=FUEL_TRANSPORTATION
+            )
+        else:
+            summary_frame.index = pd.MultiIndex.from_tuples(
+                [], names=[FUEL_TRANSPORTATION, ZONE_FROM, ZONE_TO, MODEL_YEAR]
+            )
+
+    # Convert index levels to datetime objects, if necessary
+    if config.index_levels_convert_to_datetime is not None:
+        summary_frame = convert_index_levels_to_datetime(
+            summary_frame, levels=config.index_levels_convert_to_datetime, format="%Y"
+        )
+
+    # Reindex to ensure all model years are included in the output
+    summary_frame = _reindex_to_modeled_years(summary_frame, temporal_settings=resolve_case.temporal_settings)
+
+    # Write the output file
+    _write_summary_file(summary_frame.sort_index(), output_dir / config.filename, fmt=fmt, decimals=3)
+
+
 @timer
-def export_all_results_summary(resolve_case: ResolveCase, output_dir: os.PathLike):
-    os.makedirs(output_dir, exist_ok=True)
+def export_all_results_summary(resolve_case: ResolveCase, output_dir: os.PathLike, fmt: str = "csv"):
+    output_dir = pathlib.Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Write temporal settings summary
     temporal_settings_summary = _create_temporal_settings_summary(resolve_case)
-    temporal_settings_summary.sort_index().to_csv(os.path.join(output_dir, "temporal_settings_summary.csv"))
+    _write_summary_file(temporal_settings_summary.sort_index(), output_dir / "temporal_settings_summary.csv", fmt=fmt)
 
     # Write system costs summary
     if system_cost_data := {cost: obj.annual_cost.data for cost, obj in resolve_case.system.system_costs.items()}:
-        system_costs = pd.concat(system_cost_data, axis=1)
-        system_costs.sort_index().to_csv(output_dir / "non_optimized_system_costs_summary.csv", index=True)
-
-    # Hacky exporting of load components
-    hourly_loads = resolve_case.hourly_loads
-    resolve_case.hourly_loads.index.names = ["MODEL_YEARS", "REP_PERIODS", "HOURS"]
-    resolve_case.hourly_loads.round(3).to_csv(output_dir / "hourly_load_components_summary.csv", index=True)
-
-    # Calculate annual load components
-    hourly_loads = hourly_loads.reset_index()
-    hourly_loads = hourly_loads.merge(
-        pd.Series(resolve_case.model.rep_periods_per_model_year.extract_values(), name="rep_periods_per_model_year"),
-        left_on="MODEL_YEARS",
-        right_index=True,
-    )
-    hourly_loads = hourly_loads.merge(
-        pd.Series(resolve_case.model.rep_period_weight.extract_values(), name="rep_period_weight"),
-        left_on="REP_PERIODS",
-        right_index=True,
-    )
-    hourly_loads = hourly_loads.merge(
-        pd.Series(resolve_case.temporal_settings.timesteps, name="timesteps"), left_on="HOURS", right_index=True
+        system_costs = pd.concat(system_cost_data, axis=1, sort=False)
+        _write_summary_file(system_costs.sort_index(), output_dir / "non_optimized_system_costs_summary.csv", fmt=fmt)
+
+    # Hacky exporting of load components. Name the index levels on a shallow copy, so that the ResolveCase's hourly
+    # loads aren't modified (and the load data isn't copied)
+    hourly_loads = resolve_case.hourly_loads.copy(deep=False)
+    hourly_loads.index = hourly_loads.index.set_names(["MODEL_YEARS", "REP_PERIODS", "HOURS"])
+    _write_summary_file(hourly_loads, output_dir / "hourly_load_components_summary.csv", fmt=fmt, decimals=3)
+
+    # Calculate annual load components. Look up each hour's weights from the (few) unique values of its index levels
+    hourly_load_index = hourly_loads.index
+    weights = (
+        _map_index_level(
+            hourly_load_index, "MODEL_YEARS", resolve_case.model.rep_periods_per_model_year.extract_values()
+        )
+        * _map_index_level(hourly_load_index, "REP_PERIODS", resolve_case.model.rep_period_weight.extract_values())
+        * _map_index_level(hourly_load_index, "HOURS", resolve_case.temporal_settings.timesteps)
     )
-    hourly_loads = hourly_loads.set_index(["MODEL_YEARS", "REP_PERIODS", "HOURS"])
-    for col in hourly_loads.columns:
-        if col not in ["rep_periods_per_model_year", "rep_period_weight", "timesteps"]:
-            hourly_loads[col] = (
-                hourly_loads[col]
-                * hourly_loads["rep_periods_per_model_year"]
-                * hourly_loads["rep_period_weight"]
-                * hourly_loads["timesteps"]
-            )
-    annual_loads = (
-        hourly_loads.groupby(level="MODEL_YEARS")
-        .sum()
-        .drop(["rep_periods_per_model_year", "rep_period_weight", "timesteps"], axis=1)
+    # Like the inner joins of a merge, drop hours that don't have all of their weights
+    has_weights = ~np.isnan(weights)
+
+    # Weight & sum the loads for each model year with one weighted `np.bincount` per load column (i.e., a scatter-add
+    # over the hours, without a dense model year x hour matrix), rather than summing through a groupby. Like
+    # `groupby().sum()`, model years are sorted and missing values are skipped.
+    load_columns = hourly_loads.columns
+    model_year_codes, model_years = pd.factorize(
+        hourly_load_index.get_level_values("MODEL_YEARS")[has_weights], sort=True
     )
-    annual_loads.round(3).to_csv(output_dir / "annual_load_components_summary.csv", index=True)
-
-    # Write out each config file
-    for config in [
-        FileConfig(
-            component_dict=resolve_case.system.resources,
-            column_attribute_mapping=_RESOURCE_ATTRIBUTE_COLUMN_MAPPING,
-            add_electric_zone_to_index=True,
-            index_names=(RESOURCE, ZONE, MODEL_YEAR),
-            attributes_are_timeseries=True,
-            index_levels_convert_to_datetime=None,
-            filename=RESOURCE_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.resources,
-            column_attribute_mapping=_RESOURCE_DISPATCH_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=True,
-            index_names=(RESOURCE, ZONE, MODEL_YEAR, "Rep_Period", "Hour"),
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=RESOURCE_DISPATCH_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.resources,
-            column_attribute_mapping=_FUEL_BURN_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=True,
-            index_names=(RESOURCE, ZONE, FUEL, MODEL_YEAR),
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=RESOURCE_FUEL_BURN_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict={
-                asset_name: asset
-                for asset_name, asset in resolve_case.system.electric_assets.items()
-                if (
-                    asset_name not in resolve_case.system.resources.keys()
-                    and asset_name not in resolve_case.system.tx_paths.keys()
-                )
-            },
-            column_attribute_mapping=_ASSET_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=True,
-            add_electric_zone_to_index=False,
-            index_names=(ASSET, MODEL_YEAR),
-            index_levels_convert_to_datetime=None,
-            filename=ASSET_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.zones,
-            column_attribute_mapping=_ZONAL_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=True,
-            add_electric_zone_to_index=False,
-            index_names=(ZONE, MODEL_YEAR),
-            index_levels_convert_to_datetime=None,
-            filename=ZONAL_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.zones,
-            column_attribute_mapping=_ZONAL_PRICE_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=False,
-            index_names=(ZONE, MODEL_YEAR, "Rep Period", "Hour"),
-            index_levels_convert_to_datetime=None,
-            filename=ZONAL_PRICE_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.tx_paths,
-            column_attribute_mapping=_TRANSMISSION_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=True,
-            add_electric_zone_to_index=False,
-            index_names=(TRANSMISSION_PATH, MODEL_YEAR),
-            index_levels_convert_to_datetime=None,
-            filename=TRANSMISSION_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.policies,
-            column_attribute_mapping=_POLICY_DUALS_ATTRIBUTE_COLUMN_MAPPING,
-            add_electric_zone_to_index=False,
-            index_names=(POLICY, MODEL_YEAR),
-            attributes_are_timeseries=True,
-            index_levels_convert_to_datetime=None,
-            filename=POLICY_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict={
-                policy_name: policy
-                for policy_name, policy in resolve_case.system.policies.items()
-                if policy.type == "energy"
-            },
-            column_attribute_mapping=_ENERGY_POLICY_ATTRIBUTE_COLUMN_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=False,
-            index_names=(POLICY, RESOURCE, MODEL_YEAR),
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=ENERGY_POLICY_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict={
-                policy_name: policy
-                for policy_name, policy in resolve_case.system.policies.items()
-                if policy.type == "emissions"
-            },
-            column_attribute_mapping=_EMISSIONS_POLICY_RESOURCE_COLUMN_ATTRIBUTE_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=False,
-            index_names=(POLICY, RESOURCE, MODEL_YEAR),
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=EMISSIONS_POLICY_RESOURCE_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict={
-                policy_name: policy
-                for policy_name, policy in resolve_case.system.policies.items()
-                if policy.type == "emissions"
-            },
-            column_attribute_mapping=_EMISSIONS_POLICY_TX_PATH_COLUMN_ATTRIBUTE_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=False,
-            index_names=(POLICY, TRANSMISSION_PATH, MODEL_YEAR),
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=EMISSIONS_POLICY_TX_PATH_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict={
-                policy_name: policy
-                for policy_name, policy in resolve_case.system.policies.items()
-                if policy.type == "prm"
-            },
-            column_attribute_mapping=_PRM_POLICY_RESOURCE_SUMMARY_COLUMN_ATTRIBUTE_MAPPING,
-            attributes_are_timeseries=False,
-            add_electric_zone_to_index=False,
-            index_names=(POLICY, RESOURCE, MODEL_YEAR),
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=PRM_POLICY_RESOURCE_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.electrolyzers,
-            column_attribute_mapping=_ELECTROLYZER_COLUMN_ATTRIBUTE_MAPPING,
-            index_names=(ELECTROLYZER, ZONE, FUEL_ZONE, MODEL_YEAR),
-            add_electric_zone_to_index=True,
-            add_fuel_zone_to_index=True,
-            attributes_are_timeseries=True,
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=ELECTROLYZER_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.fuel_storages,
-            column_attribute_mapping=_FUEL_STORAGE_COLUMN_ATTRIBUTE_MAPPING,
-            index_names=(FUEL_STORAGE, ZONE, FUEL_ZONE, MODEL_YEAR),
-            add_electric_zone_to_index=True,
-            add_fuel_zone_to_index=True,
-            attributes_are_timeseries=True,
-            index_levels_convert_to_datetime=None,
-            filename=FUEL_STORAGE_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.fuel_transportations,
-            column_attribute_mapping=_FUEL_TRANSPORTATION_ATTRIBUTE_COLUMN_MAPPING,
-            index_names=(FUEL_TRANSPORTATION, MODEL_YEAR),
-            add_electric_zone_to_index=False,
-            add_fuel_zone_to_index=False,
-            attributes_are_timeseries=True,
-            index_levels_convert_to_datetime=None,
-            filename=FUEL_TRANSPORTATION_SUMMARY_FILENAME,
-        ),
-        FileConfig(
-            component_dict=resolve_case.system.fuel_conversion_plants,
-            column_attribute_mapping=_FUEL_CONVERSION_PLANT_ATTRIBUTE_COLUMN_MAPPING,
-            index_names=(FUEL_CONVERSION_PLANT, ZONE, FUEL_ZONE, MODEL_YEAR),
-            attributes_are_timeseries=True,
-            add_electric_zone_to_index=True,
-            add_fuel_zone_to_index=True,
-            index_levels_convert_to_datetime=MODEL_YEAR,
-            filename=FUEL_CONVERSION_PLANT_SUMMARY_FILENAME,
-        ),
-    ]:
-        # Create the summary dataframe
-        logger.info(f"Saving {config.filename}")
-        summary_frame = _create_attribute_df(
-            component_dict=config.component_dict,
-            column_attribute_mapping=config.column_attribute_mapping,
-            add_electric_zone_to_index=config.add_electric_zone_to_index,
-            add_fuel_zone_to_index=config.add_fuel_zone_to_index,
-            index_names=config.index_names,
-            attributes_are_timeseries=config.attributes_are_timeseries,
+    hour_weights = weights[has_weights]
+    load_values = np.nan_to_num(hourly_loads.to_numpy(dtype=float)[has_weights], nan=0.0)
+    annual_load_values = np.zeros((len(model_years), len(load_columns)))
+    for i in range(len(load_columns)):
+        annual_load_values[:, i] = np.bincount(
+            model_year_codes, weights=load_values[:, i] * hour_weights, minlength=len(model_years)
         )
+    annual_loads = pd.DataFrame(
+        annual_load_values, index=pd.Index(model_years, name="MODEL_YEARS"), columns=load_columns
+    )
+    _write_summary_file(annual_loads, output_dir / "annual_load_components_summary.csv", fmt=fmt, decimals=3)
 
-        # Add the "to" and "from" zones for transmission lines to the index for output
-        if config.filename == TRANSMISSION_SUMMARY_FILENAME:
-            if len(summary_frame) > 0:
-                zone_names = pd.DataFrame.from_dict(
-                    {
-                        tx_path_name: {
-                            ZONE_FROM: tx_path.from_zone._instance_from.name,
-                            ZONE_TO: tx_path.to_zone._instance_from.name,
-                        }
-                        for tx_path_name, tx_path in resolve_case.system.tx_paths.items()
-                    },
-                    orient="index",
-                ).rename_axis(index=TRANSMISSION_PATH)
-
-                summary_frame = summary_frame.join(zone_names, on=TRANSMISSION_PATH, how="left")
-
-                summary_frame = summary_frame.set_index([ZONE_FROM, ZONE_TO], append=True).reorder_levels(
-                    [TRANSMISSION_PATH, ZONE_FROM, ZONE_TO, MODEL_YEAR]
-                )
-            else:
-                summary_frame.index = pd.MultiIndex.from_tuples(
-                    [], names=[TRANSMISSION_PATH, ZONE_FROM, ZONE_TO, MODEL_YEAR]
-                )
-
-        # Add the "to" and "from" zones for the fuel transportation component to the index for output
-        if config.filename == FUEL_TRANSPORTATION_SUMMARY_FILENAME:
-            if len(summary_frame) > 0:
-                zone_names = pd.DataFrame.from_dict(
-                    {
-                        fuel_transportation_name: {
-                            ZONE_FROM: fuel_transportation.from_zone._instance_from.name,
-                            ZONE_TO: fuel_transportation.to_zone._instance_from.name,
-                        }
-                        for fuel_transportation_name, fuel_transportation in resolve_case.system.fuel_transportations.items()
-                    },
-                    orient="index",
-                ).rename_axis(index=FUEL_TRANSPORTATION)
-
-                summary_frame = summary_frame.join(zone_names, on=FUEL_TRANSPORTATION, how="left")
-
-                summary_frame = summary_frame.set_index([ZONE_FROM, ZONE_TO], append=True).reorder_levels(
-                    [FUEL_TRANSPORTATION, ZONE_FROM, ZONE_TO, MODEL_YEAR]
-                )
-            else:
-                summary_frame.index = pd.MultiIndex.from_tuples(
-                    [], names=[FUEL_TRANSPORTATION, ZONE_FROM, ZONE_TO, MODEL_YEAR]
-                )
-
-        # Convert index levels to datetime objects, if necessary
-        if config.index_levels_convert_to_datetime is not None:
-            summary_frame = convert_index_levels_to_datetime(
-                summary_frame, levels=config.index_levels_convert_to_datetime, format="%Y"
-            )
-
-        # Reindex to ensure all model years are included in the output
-        summary_frame = _reindex_to_modeled_years(summary_frame, temporal_settings=resolve_case.temporal_settings)
-
-        # Write the output file
-        summary_frame.round(3).sort_index().to_csv(output_dir / config.filename)
+    # Write out each config file. These run sequentially, since building the summaries reads component properties that
+    # fill lazy caches (e.g., `Timeseries._data_dict`) without any locking
+    for config in _FILE_CONFIGS:
+        _export_summary_file(config, resolve_case=resolve_case, output_dir=output_dir, fmt=fmt)
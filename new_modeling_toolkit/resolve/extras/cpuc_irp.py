@@ -2,13 +2,137 @@
   - Forward & reverse simultaneous transmission flow constraints
   - Hydro dispatch constraints (Pmin, Pmax, daily energy budgets) for 37 representative days
 """
+import functools
+import pathlib
+
 import pandas as pd
 import pyomo.environ as pyo
 from loguru import logger
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 from new_modeling_toolkit.core.utils.pyomo_utils import mark_pyomo_component
 from new_modeling_toolkit.resolve.model_formulation import ResolveCase
 
+# Default for the `simultaneous_flow_unbounded_limit` extras setting: simultaneous flow limits at or above this value
+# are treated as "no limit" (i.e., no constraint is created)
+_DEFAULT_UNBOUNDED_SIMULTANEOUS_FLOW_LIMIT = 1e9
+
+
+def _get_path_and_mtime(path: pathlib.Path) -> tuple[str, int]:
+    """Get the arguments for the cached CSV loaders below, so that a CSV is re-read if it has been modified."""
+    return str(path), path.stat().st_mtime_ns
+
+
+@functools.lru_cache(maxsize=8)
+def _load_simultaneous_flow_groups(
+    path: str, mtime_ns: int
+) -> tuple[tuple, dict[str, tuple[str, ...]], dict[str, tuple[str, ...]], dict[str, tuple[str, ...]]]:
+    """Read & pre-process `simultaneous_flow_groups.csv`.
+
+    Results are cached, so running multiple cases in one process only parses the CSV once (unless it's modified).
+    The returned objects are shared between calls, so they should not be modified.
+
+    Args:
+        path: Path to `simultaneous_flow_groups.csv`
+        mtime_ns: Modification time of the CSV (only used as part of the cache key)
+
+    Returns:
+        simultaneous_flow_groups_map: Sorted (group, transmission path) pairs in the CSV
+        tx_paths_by_simultaneous_flow_group: Sorted transmission paths in each group
+        forward_tx_paths_by_simultaneous_flow_group: Sorted transmission paths in each group with a "forward" direction
+        reverse_tx_paths_by_simultaneous_flow_group: Sorted transmission paths in each group with a "reverse" direction
+    """
+    simultaneous_flow_groups = pd.read_csv(path, index_col=[0, 1])
+
+    # Group the transmission paths in one pass (rather than scanning all rows for each group). Rows without a
+    # transmission path (e.g., stray header rows) leave their group with no paths.
+    tx_paths_by_simultaneous_flow_group = {}
+    for sim_flow, tx_path in simultaneous_flow_groups.index:
+        tx_paths = tx_paths_by_simultaneous_flow_group.setdefault(sim_flow, set())
+        if not pd.isna(tx_path):
+            tx_paths.add(tx_path)
+    tx_paths_by_simultaneous_flow_group = {
+        sim_flow: tuple(sorted(tx_paths)) for sim_flow, tx_paths in tx_paths_by_simultaneous_flow_group.items()
+    }
+
+    # Flow directions are only used to build the constraint expressions, so keep them in a plain dict (rather than a
+    # pyomo Param)
+    simultaneous_flow_directions = {
+        (sim_flow, tx_path): direction
+        for (sim_flow, tx_path), direction in simultaneous_flow_groups.iloc[:, 0].items()
+        if not pd.isna(tx_path)
+    }
+    if invalid_directions := set(simultaneous_flow_directions.values()) - {"forward", "reverse"}:
+        raise ValueError(
+            f"Simultaneous flow directions must be 'forward' or 'reverse', but found: {invalid_directions}"
+        )
+
+    # Split each group's paths by direction once, so that the constraint rule doesn't compare directions per term
+    # (in a single pass over the paths)
+    forward_tx_paths_by_simultaneous_flow_group = {}
+    reverse_tx_paths_by_simultaneous_flow_group = {}
+    for sim_flow, tx_paths in tx_paths_by_simultaneous_flow_group.items():
+        tx_paths_by_direction = {"forward": [], "reverse": []}
+        for tx_path in tx_paths:
+            tx_paths_by_direction[simultaneous_flow_directions[sim_flow, tx_path]].append(tx_path)
+        forward_tx_paths_by_simultaneous_flow_group[sim_flow] = tuple(tx_paths_by_direction["forward"])
+        reverse_tx_paths_by_simultaneous_flow_group[sim_flow] = tuple(tx_paths_by_direction["reverse"])
+
+    return (
+        tuple(sorted(simultaneous_flow_groups.index.unique().values)),
+        tx_paths_by_simultaneous_flow_group,
+        forward_tx_paths_by_simultaneous_flow_group,
+        reverse_tx_paths_by_simultaneous_flow_group,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_simultaneous_flow_limits(path: str, mtime_ns: int) -> dict[tuple[str, int], float]:
+    """Read `simultaneous_flow_limits.csv` as a dict of {(group, model year): limit}.
+
+    Each group's limits are taken from its first row. Like `_load_simultaneous_flow_groups()`, results are cached and
+    should not be modified.
+
+    Args:
+        path: Path to `simultaneous_flow_limits.csv`
+        mtime_ns: Modification time of the CSV (only used as part of the cache key)
+
+    Returns:
+        simultaneous_flow_limits_by_year: Simultaneous flow limit for each group & model year
+    """
+    simultaneous_flow_limits = pd.read_csv(path, index_col=[0, 1])
+    model_years = [int(model_year) for model_year in simultaneous_flow_limits.columns]
+    is_first_row = ~simultaneous_flow_limits.index.get_level_values(0).duplicated()
+
+    return {
+        (sim_flow, model_year): limit
+        for (sim_flow, _), limits in zip(
+            simultaneous_flow_limits.index[is_first_row], simultaneous_flow_limits.to_numpy()[is_first_row]
+        )
+        for model_year, limit in zip(model_years, limits)
+    }
+
+
+def _get_unbounded_simultaneous_flow_limit(resolve: ResolveCase) -> float:
+    """Get the `simultaneous_flow_unbounded_limit` setting from the (optional) `extras/attributes.csv` settings file.
+
+    The file uses the same `timestamp,attribute,value` format as the RESOLVE case's `attributes.csv`.
+
+    Returns:
+        unbounded_limit: Simultaneous flow limits at or above this value are not constrained (default of 1e9)
+    """
+    if "attributes.csv" not in resolve.dir_structure.get_resolve_settings_extras_files():
+        return _DEFAULT_UNBOUNDED_SIMULTANEOUS_FLOW_LIMIT
+
+    extras_attributes = pd.read_csv(resolve.dir_structure.resolve_settings_dir / "extras" / "attributes.csv")
+    unbounded_limit = extras_attributes.loc[
+        extras_attributes["attribute"] == "simultaneous_flow_unbounded_limit", "value"
+    ]
+    if len(unbounded_limit) == 0:
+        return _DEFAULT_UNBOUNDED_SIMULTANEOUS_FLOW_LIMIT
+
+    return float(unbounded_limit.iloc[-1])
+
 
 def main(resolve: ResolveCase) -> ResolveCase:
     """Main function, which will be called by `run_opt.py`.
@@ -20,60 +144,86 @@ def main(resolve: ResolveCase) -> ResolveCase:
      resolve: Updated resolve instance (e.g., with additional/modified constraints).
     """
 
-    if (resolve.dir_structure.resolve_settings_dir / "extras" / "simultaneous_flow_groups.csv").exists():
+    extras_dir = resolve.dir_structure.resolve_settings_dir / "extras"
+    if "simultaneous_flow_groups.csv" in resolve.dir_structure.get_resolve_settings_extras_files():
         logger.info("Adding simultaneous flow constraints")
 
         ### Simultaneous Flows ###
 
-        simultaneous_flow_groups = pd.read_csv(
-            resolve.dir_structure.resolve_settings_dir / "extras" / "simultaneous_flow_groups.csv", index_col=[0, 1]
+        (
+            simultaneous_flow_groups_map,
+            tx_paths_by_simultaneous_flow_group,
+            forward_tx_paths_by_simultaneous_flow_group,
+            reverse_tx_paths_by_simultaneous_flow_group,
+        ) = _load_simultaneous_flow_groups(*_get_path_and_mtime(extras_dir / "simultaneous_flow_groups.csv"))
+        simultaneous_flow_limits_by_year = _load_simultaneous_flow_limits(
+            *_get_path_and_mtime(extras_dir / "simultaneous_flow_limits.csv")
         )
 
-        resolve.model.SIMULTANEOUS_FLOW_GROUPS_MAP = pyo.Set(
-            initialize=sorted(simultaneous_flow_groups.index.unique().values)
-        )
-        resolve.model.SIMULTANEOUS_FLOW_GROUPS = pyo.Set(
-            initialize=sorted(set(tup[0] for tup in simultaneous_flow_groups.index.values))
-        )
+        resolve.model.SIMULTANEOUS_FLOW_GROUPS_MAP = pyo.Set(initialize=simultaneous_flow_groups_map)
+        resolve.model.SIMULTANEOUS_FLOW_GROUPS = pyo.Set(initialize=sorted(tx_paths_by_simultaneous_flow_group))
         resolve.model.TX_PATHS_BY_SIMULTANEOUS_FLOW_GROUP = pyo.Set(
             resolve.model.SIMULTANEOUS_FLOW_GROUPS,
             within=resolve.model.TRANSMISSION_LINES,
-            initialize=(
-                lambda m, sim_flow: sorted(
-                    set(tup[1] for tup in simultaneous_flow_groups.index.values if tup[0] == sim_flow)
-                )
-            ),
-        )
-
-        resolve.model.simultaneous_flow_direction = pyo.Param(
-            resolve.model.SIMULTANEOUS_FLOW_GROUPS_MAP,
-            within=["forward", "reverse"],
-            initialize=lambda m, sim_flow, tx_path: simultaneous_flow_groups.loc[sim_flow, tx_path].values[0],
+            initialize=lambda m, sim_flow: tx_paths_by_simultaneous_flow_group[sim_flow],
         )
 
-        simultaneous_flow_limits = pd.read_csv(
-            resolve.dir_structure.resolve_settings_dir / "extras" / "simultaneous_flow_limits.csv", index_col=[0, 1]
-        )
-        simultaneous_flow_limits.columns = simultaneous_flow_limits.columns.astype(int)
-
+        # Initialize the Param from a dict in one shot (rather than calling a rule for each index). Only modeled groups
+        # & years are kept, and a missing limit still raises a KeyError here.
         resolve.model.simultaneous_flow_limit = pyo.Param(
             resolve.model.SIMULTANEOUS_FLOW_GROUPS,
             resolve.model.MODEL_YEARS,
-            initialize=lambda m, sim_flow, model_year: simultaneous_flow_limits.loc[sim_flow, model_year].values[0],
+            initialize={
+                (sim_flow, model_year): float(simultaneous_flow_limits_by_year[sim_flow, model_year])
+                for sim_flow in resolve.model.SIMULTANEOUS_FLOW_GROUPS
+                for model_year in resolve.model.MODEL_YEARS
+            },
         )
 
+        # Limits at or above the "unbounded" threshold aren't constrained, so warn about them (in case a real limit is
+        # that large)
+        unbounded_limit = _get_unbounded_simultaneous_flow_limit(resolve)
+        if unbounded_limits := [
+            index for index, limit in resolve.model.simultaneous_flow_limit.items() if limit >= unbounded_limit
+        ]:
+            logger.warning(
+                f"Not constraining {len(unbounded_limits)} simultaneous flow group/model year limit(s) that are >= "
+                f"{unbounded_limit:g} (`simultaneous_flow_unbounded_limit`): {unbounded_limits}"
+            )
+
+        # Forward flows count positively & reverse flows negatively. Line up each group's paths & coefficients once,
+        # rather than in each call of the constraint rule. Only groups with at least one path are included (groups
+        # without paths would otherwise get a trivial constraint for each timepoint).
+        tx_paths_and_coefs_by_simultaneous_flow_group = {}
+        for sim_flow in resolve.model.SIMULTANEOUS_FLOW_GROUPS:
+            if not tx_paths_by_simultaneous_flow_group[sim_flow]:
+                continue
+            forward_tx_paths = forward_tx_paths_by_simultaneous_flow_group[sim_flow]
+            reverse_tx_paths = reverse_tx_paths_by_simultaneous_flow_group[sim_flow]
+            tx_paths_and_coefs_by_simultaneous_flow_group[sim_flow] = (
+                forward_tx_paths + reverse_tx_paths,
+                (1,) * len(forward_tx_paths) + (-1,) * len(reverse_tx_paths),
+            )
+
         @mark_pyomo_component
         @resolve.model.Constraint(resolve.model.SIMULTANEOUS_FLOW_GROUPS, resolve.model.TIMEPOINTS)
         def Simultaneous_Flow_Constraint(model, sim_flow, model_year, rep_period, hour):
             """Constrain the sum of gross forward or reverse flows on groups of transmission paths"""
-            return (
-                sum(
-                    model.Transmit_Power_MW[tx_path, model_year, rep_period, hour]
-                    if resolve.model.simultaneous_flow_direction[sim_flow, tx_path] == "forward"
-                    else -1 * model.Transmit_Power_MW[tx_path, model_year, rep_period, hour]
-                    for tx_path in model.TX_PATHS_BY_SIMULTANEOUS_FLOW_GROUP[sim_flow]
-                )
-                <= model.simultaneous_flow_limit[sim_flow, model_year]
+            if sim_flow not in tx_paths_and_coefs_by_simultaneous_flow_group:
+                return pyo.Constraint.Skip
+
+            limit = model.simultaneous_flow_limit[sim_flow, model_year]
+            if limit >= unbounded_limit:
+                return pyo.Constraint.Skip
+
+            tx_paths, coefs = tx_paths_and_coefs_by_simultaneous_flow_group[sim_flow]
+            # Build the (linear) flow sum directly, rather than through a chain of pyomo `+` operations
+            flows = LinearExpression(
+                constant=0,
+                linear_coefs=list(coefs),
+                linear_vars=[model.Transmit_Power_MW[tx_path, model_year, rep_period, hour] for tx_path in tx_paths],
             )
 
+            return flows <= limit
+
     return resolve
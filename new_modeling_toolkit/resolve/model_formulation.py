@@ -7,13 +7,14 @@ from typing import Dict
 from typing import Optional
 from typing import Union
 
+import joblib
 import numpy as np
 import pandas as pd
 import pyomo.core
 import pyomo.environ as pyo
-import scipy.optimize
 from loguru import logger
 from pydantic import root_validator
+from pyomo.core.expr.numeric_expr import LinearExpression
 from tqdm import tqdm
 
 from new_modeling_toolkit.common import system
@@ -27,6 +28,7 @@ from new_modeling_toolkit.core.utils import util
 from new_modeling_toolkit.core.utils.core_utils import timer
 from new_modeling_toolkit.core.utils.pandas_utils import convert_index_levels_to_datetime
 from new_modeling_toolkit.core.utils.pyomo_utils import convert_pyomo_object_to_dataframe
+from new_modeling_toolkit.core.utils.pyomo_utils import get_index_labels
 from new_modeling_toolkit.core.utils.pyomo_utils import mark_pyomo_component
 from new_modeling_toolkit.resolve import settings
 from new_modeling_toolkit.system.policy import ConstraintOperator
@@ -184,44 +186,74 @@ class ResolveCase(Component):
     ###############################
     def sum_timepoint_to_annual(self, model_year, attribute, *args):
         """Aggregate timepoint-based values to annual level.
-        Args are the indices of the attribute, which can have different lengths."""
+        Args are the indices of the attribute, which can have different lengths.
+
+        Variables are summed into a single `LinearExpression` with pre-computed (numeric) weights, rather than through a
+        chain of pyomo `+` operations. Other components (e.g., Expressions) are summed term by term.
+        """
+        component = getattr(self.model, attribute)
+        timepoints = [(rep_period, hour) for hour in self.model.HOURS for rep_period in self.model.REP_PERIODS]
+        weights = [
+            float(
+                self.model.rep_period_weight[rep_period]
+                * self.model.rep_periods_per_model_year[model_year]
+                * self.temporal_settings.timesteps.at[hour]
+            )
+            for rep_period, hour in timepoints
+        ]
+
+        if component.ctype is pyo.Var:
+            return LinearExpression(
+                constant=0,
+                linear_coefs=weights,
+                linear_vars=[component[args, model_year, rep_period, hour] for rep_period, hour in timepoints],
+            )
+
         return sum(
-            getattr(self.model, attribute)[args, model_year, rep_period, hour]
-            * self.model.rep_period_weight[rep_period]
-            * self.model.rep_periods_per_model_year[model_year]
-            * self.temporal_settings.timesteps.at[hour]
-            for hour in self.model.HOURS
-            for rep_period in self.model.REP_PERIODS
+            component[args, model_year, rep_period, hour] * weight
+            for (rep_period, hour), weight in zip(timepoints, weights)
         )
 
     def sum_timepoints_to_annual_all_years(self, attribute: str):
-        if len(getattr(self.model, attribute)) == 0:
-            annual_series = None
-        else:
-            attribute_series = convert_pyomo_object_to_dataframe(getattr(self.model, attribute)).squeeze(axis=1)
-            rep_period_weights = convert_pyomo_object_to_dataframe(self.model.rep_period_weight).squeeze(axis=1)
-            rep_periods_per_model_year = convert_pyomo_object_to_dataframe(self.model.rep_periods_per_model_year).iloc[
-                :, 0
-            ]
-            timesteps = self.temporal_settings.timesteps
-            timesteps.index.name = "HOURS"
+        """Aggregate a timepoint-indexed Var or Expression to annual values for all modeled years.
 
-            missing_index_levels = [
-                set_name
-                for set_name in [self.model.MODEL_YEARS.name, self.model.REP_PERIODS.name, self.model.HOURS.name]
-                if set_name not in attribute_series.index.names
-            ]
-            if len(missing_index_levels) > 0:
-                raise ValueError(f"Expected index sets not found for attribute `{attribute}`: `{missing_index_levels}`")
-
-            weighted_attribute_series = attribute_series * timesteps * rep_period_weights * rep_periods_per_model_year
+        The component's values are extracted into a float array once & multiplied by the timepoint weights (each looked
+        up per index level), rather than converting the component to a DataFrame & broadcasting three weight Series.
+        """
+        component = getattr(self.model, attribute)
+        if len(component) == 0:
+            return None
+
+        index_names = get_index_labels(component)
+        missing_index_levels = [
+            set_name
+            for set_name in [self.model.MODEL_YEARS.name, self.model.REP_PERIODS.name, self.model.HOURS.name]
+            if set_name not in index_names
+        ]
+        if len(missing_index_levels) > 0:
+            raise ValueError(f"Expected index sets not found for attribute `{attribute}`: `{missing_index_levels}`")
+
+        values = component.extract_values()
+        if isinstance(component, pyo.Expression):
+            values = {idx: pyo.value(v) for idx, v in values.items()}
+        index = pd.MultiIndex.from_arrays(list(zip(*values.keys())), names=index_names)
+        # Uninitialized values (None) become NaN, which are skipped by the sum below
+        values = np.array(list(values.values()), dtype=float)
+
+        weights = (
+            self.temporal_settings.timesteps.reindex(index.get_level_values(self.model.HOURS.name)).to_numpy()
+            * self.temporal_settings.rep_period_weights.reindex(
+                index.get_level_values(self.model.REP_PERIODS.name)
+            ).to_numpy()
+            * pd.Series(self.model.rep_periods_per_model_year.extract_values())
+            .reindex(index.get_level_values(self.model.MODEL_YEARS.name))
+            .to_numpy()
+        )
 
-            grouping_levels = [
-                level
-                for level in weighted_attribute_series.index.names
-                if level not in {self.model.REP_PERIODS.name, self.model.HOURS.name}
-            ]
-            annual_series = weighted_attribute_series.groupby(grouping_levels).sum()
+        grouping_levels = [
+            level for level in index_names if level not in {self.model.REP_PERIODS.name, self.model.HOURS.name}
+        ]
+        annual_series = pd.Series(values * weights, index=index, name=attribute).groupby(grouping_levels).sum()
 
         return annual_series
 
@@ -280,36 +312,56 @@ class ResolveCase(Component):
                 f"Helper method '_get' argument 'slice_by' should be either None, or an index in MODEL_YEARS or TIMEPOINTS."
             )
 
+    def _get_hourly_loads(self, loads: dict) -> pd.DataFrame:
+        """Get each load's (modeled year, rep period, hour) profile values as a column of a DataFrame.
+
+        Each load's profile is sliced for all rep period hours of a modeled year at once (see
+        `Timeseries.slice_by_timepoints()`), rather than one timepoint at a time.
+
+        Args:
+            loads: Loads to get hourly profiles for
+
+        Returns:
+            hourly_loads: Hourly loads indexed by (modeled year, rep period, hour), with one column per load
+        """
+        model_years = list(self.model.MODEL_YEARS)
+        rep_periods = list(self.model.REP_PERIODS)
+        hours = list(self.model.HOURS)
+
+        return pd.DataFrame(
+            {
+                name: np.concatenate(
+                    [
+                        obj.scaled_profile_by_modeled_year[modeled_year].slice_by_timepoints(
+                            self.temporal_settings, modeled_year, rep_periods, hours
+                        )
+                        for modeled_year in model_years
+                    ]
+                )
+                for name, obj in loads.items()
+            },
+            index=pd.MultiIndex.from_product([model_years, rep_periods, hours]),
+        )
+
     @timer
     def update_load_components(self):
         """The annual energy on the rep periods may not add up to 100% of the original 8760, so do a simple re-scaling."""
-        self.unadjusted_hourly_loads = pd.DataFrame.from_dict({
-            name: {
-                (modeled_year, period, hour):
-                    obj.scaled_profile_by_modeled_year[modeled_year].slice_by_timepoint(
-                        self.temporal_settings,
-                        modeled_year, period, hour
-                    )
-                for modeled_year in self.model.MODEL_YEARS
-                for period in self.model.REP_PERIODS
-                for hour in self.model.HOURS
-            }
-            for name, obj in self.system.loads.items()
-            if obj.scale_by_energy
-        })
-
-        self.temporal_settings.rep_period_weights.name = "rep_period_weights"
-        rep_period_weights_reindexed = pd.merge(
-            self.unadjusted_hourly_loads,
-            self.temporal_settings.rep_period_weights,
-            left_on=self.unadjusted_hourly_loads.index.get_level_values(1),
-            right_index=True,
-        )["rep_period_weights"]
-        load_scalars = (
-                365 *
-                self.unadjusted_hourly_loads.multiply(rep_period_weights_reindexed, axis=0)
-        ).groupby(self.unadjusted_hourly_loads.index.get_level_values(0)).sum()
-        load_scalars.index = pd.to_datetime(load_scalars.index, format="%Y")
+        self.unadjusted_hourly_loads = self._get_hourly_loads(
+            {name: obj for name, obj in self.system.loads.items() if obj.scale_by_energy}
+        )
+
+        # Weight each (modeled year, rep period, hour) row by its rep period weight, then sum the rows of each modeled
+        # year (rows are ordered by modeled year, so the sum is over a reshaped array rather than a groupby)
+        model_years = list(self.model.MODEL_YEARS)
+        rep_period_weights = self.temporal_settings.rep_period_weights.reindex(
+            self.unadjusted_hourly_loads.index.get_level_values(1)
+        ).to_numpy()
+        weighted_hourly_loads = 365 * self.unadjusted_hourly_loads.to_numpy() * rep_period_weights[:, np.newaxis]
+        load_scalars = pd.DataFrame(
+            weighted_hourly_loads.reshape(len(model_years), -1, len(self.unadjusted_hourly_loads.columns)).sum(axis=1),
+            index=pd.to_datetime(model_years, format="%Y"),
+            columns=self.unadjusted_hourly_loads.columns,
+        )
 
         # Re-scale loads to make annual energy match
 
@@ -341,98 +393,120 @@ class ResolveCase(Component):
                 )
 
         # Get re-scaled hourly loads (for results reporting)
-        self.hourly_loads = pd.DataFrame.from_dict({
-            name: {
-                (modeled_year, period, hour):
-                    obj.scaled_profile_by_modeled_year[modeled_year].slice_by_timepoint(
-                        self.temporal_settings,
-                        modeled_year, period, hour
-                    )
-                for modeled_year in self.model.MODEL_YEARS
-                for period in self.model.REP_PERIODS
-                for hour in self.model.HOURS
-            }
-            for name, obj in self.system.loads.items()
-        })
+        self.hourly_loads = self._get_hourly_loads(self.system.loads)
+
+    def _get_sampled_hour_weights(self, rep_periods: list, hours: list) -> np.ndarray:
+        """Get the fraction of a year that each (rep period, hour) represents, ordered by rep period and then hour."""
+        return 365 * np.repeat(self.temporal_settings.rep_period_weights.loc[rep_periods].to_numpy(), len(hours)) / 8760
 
     def get_sampled_profile_cf(self, profile: ts.Timeseries) -> float:
-        sampled_profile = pd.Series({
-            (period, hour):
-                profile.slice_by_timepoint(
-                    self.temporal_settings, self.model.MODEL_YEARS.first(), period, hour
-                )
-            for period in self.model.REP_PERIODS
-            for hour in self.model.HOURS
-        }).to_frame(name="value")
-
-        # Join rep period weights
-        self.temporal_settings.rep_period_weights.name = "rep_period_weights"
-        rep_period_weights_reindexed = pd.merge(
-            sampled_profile,
-            self.temporal_settings.rep_period_weights,
-            left_on=sampled_profile.index.get_level_values(0),
-            right_index=True,
-        )["rep_period_weights"]
+        rep_periods = list(self.model.REP_PERIODS)
+        hours = list(self.model.HOURS)
+        # Slice all rep period hours at once, ordered by rep period and then hour
+        sampled_profile = profile.slice_by_timepoints(
+            self.temporal_settings, self.model.MODEL_YEARS.first(), rep_periods, hours
+        )
 
         # Calculate CFs
-        sampled_cf = (365 * sampled_profile.multiply(rep_period_weights_reindexed, axis=0)).sum().value / 8760
+        sampled_cf = np.dot(sampled_profile, self._get_sampled_hour_weights(rep_periods, hours))
         return sampled_cf
 
-    def test_profile_scaling(self, scalar, profile: ts.Timeseries, target_cf: float):
-        test_profile = profile.copy(deep=True)
-
-        scale_resource_profile(profile=test_profile, scalar=scalar)
-
-        sampled_cf = self.get_sampled_profile_cf(test_profile)
-
-        return sampled_cf - target_cf
-
     @timer
     def update_resource_profiles(self):
         """Really hacky adjustment to make sure sampled CF matches original (un-sampled) CF.
 
-        Ideally want to parallelize this, but `self` is not picklable, so need to make this a static method instead of instance method.
+        Profiles that haven't been re-scaled before are fit all at once (see `fit_resource_profile_scalars()`).
         """
         logger.info(f"Looking for re-scaled profiles using ID {hash(self.temporal_settings)}")
         rescaled_profile_dir = self.dir_structure.data_processed_dir / "resolve" / "rescaled profiles" / f"{hash(self.temporal_settings)}"
         rescaled_profile_dir.mkdir(parents=True, exist_ok=True)
 
-        for resource, obj in tqdm(
-            self.system.resources.items(),
-            desc="Re-scaling resource profiles:".ljust(48),
-            bar_format="{l_bar}{bar:30}{r_bar}{bar:-10b}",
-        ):
+        rescaled_resources = {}
+        resources_to_rescale = {}
+        for resource, obj in self.system.resources.items():
             # Only scale solar & wind profiles
             if not any(name in resource for name in ["Solar", "PV", "Wind"]):
                 continue
 
             # If re-scaled profile already exists
             if (rescaled_profile_dir / f"{obj.name}.csv").exists():
-                obj.provide_power_potential_profile.data = pd.read_csv(rescaled_profile_dir / f"{obj.name}.csv", parse_dates=True, infer_datetime_format=True, index_col=0).squeeze(axis=1)
-                obj.provide_power_potential_profile._data_dict = None
+                rescaled_resources[resource] = obj
+            else:
+                resources_to_rescale[resource] = obj
 
-                logger.info(
-                    f"Reading {resource} re-scaled profile from {(rescaled_profile_dir / f'{obj.name}.csv')}"
+        # Read existing re-scaled profiles in parallel (each resource's CSV is independent)
+        rescaled_profiles = joblib.Parallel(n_jobs=-1, prefer="threads")(
+            joblib.delayed(_read_rescaled_profile)(rescaled_profile_dir / f"{obj.name}.csv")
+            for obj in rescaled_resources.values()
+        )
+        for (resource, obj), rescaled_profile in zip(rescaled_resources.items(), rescaled_profiles):
+            obj.provide_power_potential_profile.data = rescaled_profile
+            obj.provide_power_potential_profile._data_dict = None
+
+            logger.info(f"Reading {resource} re-scaled profile from {(rescaled_profile_dir / f'{obj.name}.csv')}")
+
+        if not resources_to_rescale:
+            return
+
+        # Get sampled & target CFs for all profiles at once
+        rep_periods = list(self.model.REP_PERIODS)
+        hours = list(self.model.HOURS)
+        sampled_profiles = np.vstack(
+            [
+                obj.provide_power_potential_profile.slice_by_timepoints(
+                    self.temporal_settings, self.model.MODEL_YEARS.first(), rep_periods, hours
                 )
+                for obj in resources_to_rescale.values()
+            ]
+        ).astype(float)
+        sampled_hour_weights = self._get_sampled_hour_weights(rep_periods, hours)
+        original_sampled_cfs = sampled_profiles @ sampled_hour_weights
+        target_cfs = np.array(
+            [obj.provide_power_potential_profile.data.mean() for obj in resources_to_rescale.values()]
+        )
 
-            else:
-                # Get sampled CF
-                original_sampled_cf = self.get_sampled_profile_cf(obj.provide_power_potential_profile)
-                # Calculate target CF
-                target_cf = obj.provide_power_potential_profile.data.mean()
-
-                # Iterate using Newton method
-                scalar = scipy.optimize.newton(
-                    self.test_profile_scaling, 0, args=(obj.provide_power_potential_profile, target_cf), tol=0.004, maxiter=10, disp=False,
+        # A profile can only be scaled to a finite, non-zero target CF if its sampled profile isn't all zeros
+        is_fittable = np.isfinite(target_cfs) & (target_cfs > 0) & (original_sampled_cfs > 0)
+        for resource, fittable, original_sampled_cf, target_cf in zip(
+            resources_to_rescale, is_fittable, original_sampled_cfs, target_cfs
+        ):
+            if not fittable:
+                logger.warning(
+                    f"Not re-scaling {resource} profile, since its sampled capacity factor ({original_sampled_cf:.2%}) "
+                    f"can't be scaled to its target capacity factor ({target_cf:.2%})"
                 )
+        resources_to_rescale = {
+            resource: obj for (resource, obj), fittable in zip(resources_to_rescale.items(), is_fittable) if fittable
+        }
+        if not resources_to_rescale:
+            return
+        sampled_profiles = sampled_profiles[is_fittable]
+        original_sampled_cfs = original_sampled_cfs[is_fittable]
+        target_cfs = target_cfs[is_fittable]
+
+        scalars = fit_resource_profile_scalars(
+            sampled_profiles=sampled_profiles, weights=sampled_hour_weights, target_cfs=target_cfs
+        )
 
-                # Get final profile & CF
-                scale_resource_profile(profile=obj.provide_power_potential_profile, scalar=scalar)
-                final_cf = self.get_sampled_profile_cf(obj.provide_power_potential_profile)
+        for (resource, obj), scalar, original_sampled_cf, target_cf in tqdm(
+            zip(resources_to_rescale.items(), scalars, original_sampled_cfs, target_cfs),
+            total=len(resources_to_rescale),
+            desc="Re-scaling resource profiles:".ljust(48),
+            bar_format="{l_bar}{bar:30}{r_bar}{bar:-10b}",
+        ):
+            # Get final profile & CF
+            scale_resource_profile(profile=obj.provide_power_potential_profile, scalar=scalar)
+            final_cf = self.get_sampled_profile_cf(obj.provide_power_potential_profile)
 
-                obj.provide_power_potential_profile.data.to_csv(rescaled_profile_dir / f"{obj.name}.csv", index=True)
+            logger.info(f"Adjusted {resource} sampled profile capacity factor from {original_sampled_cf:.2%} to {final_cf:.2%} (target of {target_cf:.2%})")
 
-                logger.info(f"Adjusted {resource} sampled profile capacity factor from {original_sampled_cf:.2%} to {final_cf:.2%} (target of {target_cf:.2%})")
+        # Save re-scaled profiles in parallel, so they can be re-used by later cases with the same temporal settings
+        joblib.Parallel(n_jobs=-1, prefer="threads")(
+            joblib.delayed(obj.provide_power_potential_profile.data.to_csv)(
+                rescaled_profile_dir / f"{obj.name}.csv", index=True
+            )
+            for obj in resources_to_rescale.values()
+        )
 
     @timer
     def update_sampled_profiles(self):
@@ -544,15 +618,19 @@ class ResolveCase(Component):
         ##################################################
 
         # create timepoints and years mapping based on input data
-        self.model.MODEL_YEARS = pyo.Set(initialize=self.temporal_settings.modeled_years.data.index.year)
-        self.model.REP_PERIODS = pyo.Set(initialize=self.temporal_settings.rep_periods.index)
-        self.model.HOURS = pyo.Set(initialize=self.temporal_settings.rep_periods.columns)
+        # Convert pandas indexes to lists once, so that pyomo (and the comprehensions below) iterate plain Python
+        # objects instead of boxing each numpy scalar on every pass
+        rep_periods = self.temporal_settings.rep_periods.index.tolist()
+        chrono_periods = self.temporal_settings.chrono_periods.index.tolist()
+        self.model.MODEL_YEARS = pyo.Set(initialize=self.temporal_settings.modeled_years.data.index.year.tolist())
+        self.model.REP_PERIODS = pyo.Set(initialize=rep_periods)
+        self.model.HOURS = pyo.Set(initialize=self.temporal_settings.rep_periods.columns.tolist())
 
         chrono_periods_by_model_year = {}
         adj_rep_periods_by_model_year = {}
         for model_year in self.temporal_settings.modeled_years.data.index:
             if self.temporal_settings.allow_inter_period_dynamics.data.loc[model_year]:
-                chrono_periods_by_model_year[model_year.year] = self.temporal_settings.chrono_periods.index
+                chrono_periods_by_model_year[model_year.year] = chrono_periods
                 adj_rep_periods_by_model_year[model_year.year] = list(
                     set(
                         (
@@ -564,11 +642,11 @@ class ResolveCase(Component):
                                 model_year=model_year.year,
                             ),
                         )
-                        for chrono_period in self.temporal_settings.chrono_periods.index
+                        for chrono_period in chrono_periods
                     )
                 )
             else:
-                chrono_periods_by_model_year[model_year.year] = self.temporal_settings.rep_periods.index
+                chrono_periods_by_model_year[model_year.year] = rep_periods
                 adj_rep_periods_by_model_year[model_year.year] = [
                     (rep_period, rep_period) for rep_period in self.model.REP_PERIODS
                 ]
@@ -630,7 +708,7 @@ class ResolveCase(Component):
         self.model.rep_period_weight = pyo.Param(
             self.model.REP_PERIODS,
             within=pyo.NonNegativeReals,
-            initialize=lambda model, rep_period: self.temporal_settings.rep_period_weights.loc[rep_period],
+            initialize=self.temporal_settings.rep_period_weights.to_dict(),
         )
 
         # The length of each representative period
@@ -4978,6 +5056,55 @@ def scale_resource_profile(*, profile: ts.Timeseries, scalar: float) -> ts.Times
 
     profile._data_dict = None
 
+
+def fit_resource_profile_scalars(
+    *, sampled_profiles: np.ndarray, weights: np.ndarray, target_cfs: np.ndarray, tol: float = 0.004, maxiter: int = 50
+) -> np.ndarray:
+    """Find the `scale_resource_profile()` scalar for each profile so that its sampled CF matches its target CF.
+
+    All profiles are fit at once with a vectorized bisection, using the same (scale & clip to 1) transform as
+    `scale_resource_profile()`. Since the sampled CF is non-decreasing in the scalar, each profile's scalar is first
+    bracketed (by doubling the upper bound) and then bisected until all sampled CFs are within `tol` of their targets.
+
+    Args:
+        sampled_profiles: Sampled profile values, with one row per profile
+        weights: Fraction of a year that each sampled value (column) represents
+        target_cfs: Target CF for each profile
+        tol: Tolerance on the difference between the sampled & target CFs
+        maxiter: Maximum number of iterations (for both bracketing & bisection)
+
+    Returns:
+        scalars: Fitted scalar for each profile
+    """
+
+    def get_sampled_cfs(scalars: np.ndarray) -> np.ndarray:
+        return np.clip(sampled_profiles * scalars[:, np.newaxis], None, 1.0) @ weights
+
+    lower = np.zeros(len(target_cfs))
+    upper = np.ones(len(target_cfs))
+    for _ in range(maxiter):
+        is_below_target = get_sampled_cfs(upper) < target_cfs
+        if not is_below_target.any():
+            break
+        lower[is_below_target] = upper[is_below_target]
+        upper[is_below_target] *= 2
+
+    scalars = (lower + upper) / 2
+    for _ in range(maxiter):
+        errors = get_sampled_cfs(scalars) - target_cfs
+        if (np.abs(errors) <= tol).all():
+            break
+        lower = np.where(errors < 0, scalars, lower)
+        upper = np.where(errors < 0, upper, scalars)
+        scalars = (lower + upper) / 2
+
+    return scalars
+
+
+def _read_rescaled_profile(path: os.PathLike) -> pd.Series:
+    """Read a re-scaled resource profile saved by `ResolveCase.update_resource_profiles()`."""
+    return pd.read_csv(path, parse_dates=True, infer_datetime_format=True, index_col=0).squeeze(axis=1)
+
 if __name__ == "__main__":
     resolve = ResolveCase("system_input_new", dir_str.data_interim_dir / "systems")
     resolve.model.ELCC_Facet_Constraint_LHS.pprint()
@@ -1,4 +1,5 @@
 import contextlib
+import enum
 import importlib
 import pathlib
 import sys
@@ -23,6 +24,13 @@ from new_modeling_toolkit.resolve.export_results_summary import export_all_resul
 from new_modeling_toolkit.resolve.model_formulation import ResolveCase
 
 
+class ResultsSummaryFormat(str, enum.Enum):
+    """File formats that the results summary files can be written in."""
+
+    csv = "csv"
+    parquet = "parquet"
+
+
 @timer
 def solve(
     resolve_model: model_formulation.ResolveCase,
@@ -119,6 +127,8 @@ def _run_case(
     log_level: str,
     symbolic_solver_labels: bool,
     raw_results: bool,
+    archive_raw_results: bool,
+    results_summary_format: str,
 ):
     # Create ConcreteModel and link to system
     _, resolve_model = model_formulation.ResolveCase.from_csv(
@@ -142,8 +152,10 @@ def _run_case(
     resolve_model.update_system_with_solver_results()
 
     # Write results
-    export_all_results_summary(resolve_case=resolve_model, output_dir=dir_str.outputs_results_summary_dir)
-    export_results.export_results(resolve_model, raw_results=raw_results)
+    export_all_results_summary(
+        resolve_case=resolve_model, output_dir=dir_str.outputs_results_summary_dir, fmt=results_summary_format
+    )
+    export_results.export_results(resolve_model, raw_results=raw_results, archive_results=archive_raw_results)
 
     for policy in resolve_model.system.hourly_energy_policies.values():
         policy.check_constraint_violations(resolve_model.model)
@@ -188,9 +200,25 @@ def main(
         help="Whether or not to raise an exception if one occurs during running of cases. Note that if you are running "
         "multiple cases, any cases subsequent to the raised exception will not run.",
     ),
+    archive_raw_results: bool = typer.Option(
+        False,
+        help="If this option is passed, raw results CSVs are saved in a single zip archive instead of separate files.",
+    ),
+    results_summary_format: ResultsSummaryFormat = typer.Option(
+        ResultsSummaryFormat.csv, help="File format of the results summary files."
+    ),
     # TODO (2022-02-22): This should be restricted to only "approved" extras
 ) -> Optional[list[ResolveCase]]:
     logger.info(f"Resolve version: {__version__}")
+    # When `main()` is called directly (rather than through typer), options that aren't passed are still typer
+    # `OptionInfo` objects, so fall back to their plain default values
+    if isinstance(archive_raw_results, typer.models.OptionInfo):
+        archive_raw_results = archive_raw_results.default
+    if isinstance(results_summary_format, typer.models.OptionInfo):
+        results_summary_format = results_summary_format.default
+    # Validate the summary format up front (rather than when results are exported after the solve), since `main()` may
+    # also be called directly with a string
+    results_summary_format = ResultsSummaryFormat(results_summary_format).value
     # Create folder for the specific resolve run
     dir_str = DirStructure(data_folder=data_folder)
     if resolve_settings_name:
@@ -219,6 +247,8 @@ def main(
                 log_level=log_level,
                 symbolic_solver_labels=symbolic_solver_labels,
                 raw_results=raw_results,
+                archive_raw_results=archive_raw_results,
+                results_summary_format=results_summary_format,
             )
             if return_cases:
                 resolve_cases.append(resolve_model)
@@ -233,6 +263,8 @@ def main(
                     log_level=log_level,
                     symbolic_solver_labels=symbolic_solver_labels,
                     raw_results=raw_results,
+                    archive_raw_results=archive_raw_results,
+                    results_summary_format=results_summary_format,
                 )
 
                 if return_cases: